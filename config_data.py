@@ -186,6 +186,13 @@ class DeviceDefinition:
     pgn_low: int
     device_type: str  # 'powercell' or 'inmotion'
     outputs: List[str]  # List of output names
+    pwm_mask: Tuple[bool, ...] = field(init=False)  # Per-output PWM support
+    
+    def __post_init__(self):
+        # Only POWERCELL outputs 1-8 have PWM capability
+        self.pwm_mask = tuple(
+            self.device_type == "powercell" and i < 8 for i in range(len(self.outputs))
+        )
 
 # All controllable devices
 DEVICES = {
@@ -588,6 +595,10 @@ class CaseConfig:
     require_security_on: bool = False  # Case requires security to be enabled (in must_be_on)
     require_security_off: bool = False  # Case requires security to be disabled (in must_be_off)
     
+    def has_default_settings(self) -> bool:
+        """True if every setting apart from the enabled flag is at its default"""
+        return self == (_DEFAULT_ENABLED_CASE if self.enabled else _DEFAULT_CASE)
+    
     def get_can_messages(self) -> List[Tuple[int, int, int, List[int]]]:
         """
         Generate CAN messages for this case.
@@ -614,6 +625,10 @@ class CaseConfig:
         
         return messages
 
+# Reference instances for "case left at its defaults" comparisons - never mutate
+_DEFAULT_CASE = CaseConfig()
+_DEFAULT_ENABLED_CASE = CaseConfig(enabled=True)
+
 @dataclass
 class InputConfig:
     """Configuration for a single input with all its cases"""
@@ -631,6 +646,14 @@ class InputConfig:
         if not self.off_cases:
             self.off_cases = [CaseConfig() for _ in range(off_count)]
 
+    def is_empty(self) -> bool:
+        """True if there is no custom name and every case is still at its defaults"""
+        return not self.custom_name and all(
+            case == _DEFAULT_CASE
+            for cases in (self.on_cases, self.off_cases)
+            for case in cases
+        )
+
     def get_eeprom_base_address(self) -> int:
         """Calculate the EEPROM base address for this input"""
         return EEPROM_ADDR_INPUT_START + ((self.input_number - 1) * EEPROM_BYTES_PER_INPUT)
@@ -687,7 +710,11 @@ class FullConfiguration:
     @classmethod
     def from_json(cls, json_str: str) -> 'FullConfiguration':
         """Deserialize configuration from JSON"""
-        data = json.loads(json_str)
+        return cls.from_dict(json.loads(json_str))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'FullConfiguration':
+        """Build configuration from already-parsed JSON data"""
         config = cls()
         # Populate system config
         if 'system' in data:
@@ -739,12 +766,12 @@ class FullConfiguration:
                 setattr(case, ck, cv)
 
 
+_INPUT_BY_NUMBER = {inp.number: inp for inp in INPUTS}
+
+
 def get_input_definition(input_number: int) -> Optional[InputDefinition]:
     """Get input definition by number (1-44)"""
-    for inp in INPUTS:
-        if inp.number == input_number:
-            return inp
-    return None
+    return _INPUT_BY_NUMBER.get(input_number)
 
 
 def calculate_case_address(input_number: int, case_type: str, case_index: int) -> int:
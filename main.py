@@ -10,7 +10,7 @@ from datetime import datetime
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QStackedWidget, QLabel, QPushButton, QFrame, QProgressBar,
-    QMessageBox, QGraphicsDropShadowEffect, QMenuBar, QMenu, QFileDialog
+    QMessageBox, QMenuBar, QMenu, QFileDialog
 )
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QPixmap, QColor, QPalette, QLinearGradient, QPainter, QAction, QKeySequence
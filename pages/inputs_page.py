@@ -2,15 +2,16 @@
 inputs_page.py - Input configuration page (simplified, no per-input write)
 """
 
+from contextlib import contextmanager
 from typing import List
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QComboBox, QGroupBox, QGridLayout, QSpinBox, QLineEdit,
+    QComboBox, QGroupBox, QSpinBox, QLineEdit,
     QListWidget, QListWidgetItem, QSplitter, QScrollArea,
-    QFrame, QCheckBox, QSlider, QMessageBox, QMenu, QWidgetAction
+    QFrame, QCheckBox, QMessageBox, QMenu, QWidgetAction, QStyledItemDelegate
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QSignalBlocker, QTimer, QEvent, QSize
+from PyQt6.QtGui import QFont, QStandardItemModel, QStandardItem, QPainter, QColor
 
 from styles import COLORS, ICONS
 from config_data import (
@@ -21,18 +22,213 @@ from config_data import (
 )
 
 
+@contextmanager
+def _signals_blocked(*objects):
+    """Block signals on the given objects, restoring their previous state on exit"""
+    previous = [obj.blockSignals(True) for obj in objects]
+    try:
+        yield
+    finally:
+        for obj, was_blocked in zip(objects, previous):
+            obj.blockSignals(was_blocked)
+
+
+@contextmanager
+def _updates_disabled(widget):
+    """Disable updates on a widget, re-enabling them on exit unless it was already explicitly disabled"""
+    # An ancestor's disabled updates do not count - only the widget's own
+    # setUpdatesEnabled(False) (WA_ForceUpdatesDisabled) must outlive the block
+    was_forced = widget.testAttribute(Qt.WidgetAttribute.WA_ForceUpdatesDisabled)
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        if not was_forced:
+            widget.setUpdatesEnabled(True)
+
+
+def _format_timer_result(value: int, scale_10s: bool, zero_text: str) -> str:
+    """Result label text for a timer value in 0.25s or 10s steps"""
+    seconds = value * 10.0 if scale_10s else value * 0.25
+    if seconds == 0:
+        return zero_text
+    if seconds >= 60:
+        return f"= {seconds / 60:.1f}m"
+    return f"= {seconds:.2g}s"
+
+
+class _ClickableFrame(QFrame):
+    """Frame that emits clicked on a mouse press, used for collapsible headers"""
+    
+    clicked = pyqtSignal()
+    
+    def mousePressEvent(self, event):
+        self.clicked.emit()
+        event.accept()
+
+
+class _ToggleOnClickDelegate(QStyledItemDelegate):
+    """Toggles a checkable item when its row is clicked anywhere, like a QCheckBox label"""
+    
+    def editorEvent(self, event, model, option, index):
+        if (event.type() in (QEvent.Type.MouseButtonRelease, QEvent.Type.MouseButtonDblClick)
+                and event.button() == Qt.MouseButton.LeftButton
+                and index.flags() & Qt.ItemFlag.ItemIsUserCheckable):
+            if event.type() == QEvent.Type.MouseButtonRelease:
+                checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked.value
+                new_state = Qt.CheckState.Unchecked if checked else Qt.CheckState.Checked
+                model.setData(index, new_state.value, Qt.ItemDataRole.CheckStateRole)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class _DropdownPopup(QFrame):
+    """Popup frame that places itself when shown, reusing its placement until the window moves"""
+    
+    WIDTH = 650
+    
+    def __init__(self, anchor: QWidget):
+        super().__init__(anchor)
+        self._anchor = anchor
+        self._placed = False  # Size and position still valid for the current window geometry
+        self._watched_window = None
+    
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Type.Move, QEvent.Type.Resize):
+            self._placed = False
+        return False
+    
+    def showEvent(self, event):
+        window = self._anchor.window()
+        if window is not self._watched_window:
+            if self._watched_window is not None:
+                self._watched_window.removeEventFilter(self)
+            window.installEventFilter(self)
+            self._watched_window = window
+            self._placed = False
+        
+        if not self._placed:
+            screen = window.screen()
+            if screen:
+                screen_rect = screen.availableGeometry()
+                # 50% of screen height, centered vertically on screen and horizontally on the window
+                popup_height = int(screen_rect.height() * 0.5)
+                self.setFixedHeight(popup_height)
+                self.setFixedWidth(self.WIDTH)
+                
+                window_center = window.mapToGlobal(window.rect().center())
+                x = window_center.x() - self.WIDTH // 2
+                y = screen_rect.top() + (screen_rect.height() - popup_height) // 2
+                self.move(x, y)
+                self._placed = True
+            else:
+                # Fallback - position below button; follows scrolling, so never cached
+                button = self._anchor.button
+                self.move(button.mapToGlobal(button.rect().bottomLeft()))
+        
+        super().showEvent(event)
+
+
 class MultiSelectDropdown(QWidget):
     """Dropdown that allows selecting multiple inputs - 2 column scrollable layout"""
     
     selection_changed = pyqtSignal()
     
+    CELL_WIDTH = 290  # Two cells per row fit the 650px popup beside the scrollbar
+    CELL_HEIGHT = 44
+    
+    # Row and button texts per input number - formatted once at import
+    _ROW_LABELS = {
+        inp.number: f"IN{inp.number:02d}: {inp.name}" if inp.name else f"IN{inp.number:02d}"
+        for inp in INPUTS
+    }
+    _SELECTED_LABELS = {inp.number: f"IN{inp.number:02d} selected" for inp in INPUTS}
+    
+    # Shared stylesheets - built once, reused by every dropdown
+    _BUTTON_STYLE = None
+    _POPUP_STYLE = None
+    _LIST_STYLE = None
+    
+    @classmethod
+    def _init_styles(cls):
+        """Initialize shared stylesheets once"""
+        if cls._BUTTON_STYLE is None:
+            cls._BUTTON_STYLE = f"""
+                QPushButton {{
+                    text-align: left;
+                    padding: 8px 12px;
+                    padding-right: 24px;
+                    background-color: rgba(70, 70, 70, 0.9);
+                    border: none;
+                    border-radius: 8px;
+                    color: white;
+                    font-size: 13px;
+                }}
+                QPushButton:hover {{
+                    background-color: {COLORS['accent_primary']};
+                }}
+            """
+            cls._POPUP_STYLE = """
+                QFrame {
+                    background-color: rgba(55, 55, 55, 0.98);
+                    border: none;
+                    border-radius: 12px;
+                }
+            """
+            # One checkable row per input, laid out two per line
+            cls._LIST_STYLE = f"""
+                QListWidget {{
+                    background: transparent;
+                    border: none;
+                    outline: none;
+                    font-size: 14px;
+                    font-weight: 500;
+                }}
+                QListWidget::item {{
+                    padding: 10px 14px;
+                    color: white;
+                    background: rgba(70, 70, 70, 0.6);
+                    border-radius: 8px;
+                }}
+                QListWidget::item:hover {{
+                    background: rgba(90, 90, 90, 0.8);
+                }}
+                QListWidget::indicator {{
+                    width: 22px;
+                    height: 22px;
+                    border-radius: 5px;
+                    border: none;
+                    background: rgba(100, 100, 100, 0.9);
+                }}
+                QListWidget::indicator:hover {{
+                    background: rgba(120, 120, 120, 1.0);
+                }}
+                QListWidget::indicator:checked {{
+                    background: {COLORS['accent_primary']};
+                }}
+                QScrollBar:vertical {{
+                    background: rgba(40, 40, 40, 0.5);
+                    width: 8px;
+                    border-radius: 4px;
+                }}
+                QScrollBar::handle:vertical {{
+                    background: rgba(120, 120, 120, 0.8);
+                    border-radius: 4px;
+                    min-height: 30px;
+                }}
+                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+                    height: 0;
+                }}
+            """
+    
     def __init__(self, placeholder: str = "Select inputs...", parent=None):
         super().__init__(parent)
+        MultiSelectDropdown._init_styles()
         self.placeholder = placeholder
-        self.selected_items = []  # List of input numbers
-        self.checkboxes = {}  # input_number -> QCheckBox
+        self.selected_items = set()  # Selected input numbers
+        self.items = {}  # input_number -> checkable QListWidgetItem
         self.popup = None
-        self.setStyleSheet("background: transparent;")
+        self._suppress = False  # True while rows are set programmatically
         
         self._setup_ui()
     
@@ -45,185 +241,111 @@ class MultiSelectDropdown(QWidget):
         self.button = QPushButton(self.placeholder)
         self.button.setMinimumHeight(36)
         self.button.setMinimumWidth(200)
-        self.button.setStyleSheet(f"""
-            QPushButton {{
-                text-align: left;
-                padding: 8px 12px;
-                padding-right: 24px;
-                background-color: rgba(70, 70, 70, 0.9);
-                border: none;
-                border-radius: 8px;
-                color: white;
-                font-size: 13px;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['accent_primary']};
-            }}
-        """)
+        self.button.setStyleSheet(MultiSelectDropdown._BUTTON_STYLE)
         self.button.clicked.connect(self._toggle_popup)
         layout.addWidget(self.button)
         
-        # Create popup widget (hidden initially)
-        self._create_popup()
+        # Popup is built on first open - most dropdowns are never opened
     
     def _create_popup(self):
         """Create the popup with 2-column scrollable grid"""
-        self.popup = QFrame(self.window())
+        # Parented to the dropdown itself, as when it was built during __init__
+        self.popup = _DropdownPopup(self)
         self.popup.setWindowFlags(Qt.WindowType.Popup | Qt.WindowType.FramelessWindowHint)
-        self.popup.setStyleSheet(f"""
-            QFrame {{
-                background-color: rgba(55, 55, 55, 0.98);
-                border: none;
-                border-radius: 12px;
-            }}
-        """)
+        self.popup.setStyleSheet(MultiSelectDropdown._POPUP_STYLE)
         
         popup_layout = QVBoxLayout(self.popup)
         popup_layout.setContentsMargins(12, 12, 12, 12)
         popup_layout.setSpacing(8)
         
-        # Scroll area for checkboxes
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background: transparent;
-                border: none;
-            }}
-            QScrollBar:vertical {{
-                background: rgba(40, 40, 40, 0.5);
-                width: 8px;
-                border-radius: 4px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: rgba(120, 120, 120, 0.8);
-                border-radius: 4px;
-                min-height: 30px;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0;
-            }}
-        """)
-        
-        # Container for grid
-        container = QWidget()
-        container.setStyleSheet("background: transparent;")
-        grid = QGridLayout(container)
-        grid.setContentsMargins(0, 0, 0, 0)
-        grid.setSpacing(6)
-        
-        # Add checkboxes in 2 columns
-        for i, inp in enumerate(INPUTS):
-            row = i // 2
-            col = i % 2
-            
-            # Show input number and name
-            label = f"IN{inp.number:02d}: {inp.name}" if inp.name else f"IN{inp.number:02d}"
-            checkbox = QCheckBox(label)
-            checkbox.setMinimumHeight(44)
-            checkbox.setStyleSheet(f"""
-                QCheckBox {{
-                    padding: 10px 14px;
-                    color: white;
-                    font-size: 14px;
-                    font-weight: 500;
-                    background: rgba(70, 70, 70, 0.6);
-                    border-radius: 8px;
-                }}
-                QCheckBox:hover {{
-                    background: rgba(90, 90, 90, 0.8);
-                }}
-                QCheckBox::indicator {{
-                    width: 22px;
-                    height: 22px;
-                    border-radius: 5px;
-                    border: none;
-                    background: rgba(100, 100, 100, 0.9);
-                }}
-                QCheckBox::indicator:hover {{
-                    background: rgba(120, 120, 120, 1.0);
-                }}
-                QCheckBox::indicator:checked {{
-                    background: {COLORS['accent_primary']};
-                }}
-            """)
-            checkbox.stateChanged.connect(self._on_checkbox_changed)
-            self.checkboxes[inp.number] = checkbox
-            grid.addWidget(checkbox, row, col)
+        # Checkable list rows rather than one QCheckBox widget per input
+        self.input_list = QListWidget()
+        self.input_list.setStyleSheet(MultiSelectDropdown._LIST_STYLE)
+        self.input_list.setItemDelegate(_ToggleOnClickDelegate(self.input_list))
+        self.input_list.setSelectionMode(QListWidget.SelectionMode.NoSelection)
+        self.input_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.input_list.setFlow(QListWidget.Flow.LeftToRight)  # 2 columns, row by row
+        self.input_list.setWrapping(True)
+        self.input_list.setResizeMode(QListWidget.ResizeMode.Adjust)
+        self.input_list.setGridSize(QSize(self.CELL_WIDTH + 6, self.CELL_HEIGHT + 6))
+        self.input_list.setUniformItemSizes(True)  # Every row is CELL_WIDTH x CELL_HEIGHT - skip per-row size queries
+        
+        # Add all rows in one pass without repainting between them
+        self.popup.setUpdatesEnabled(False)
+        try:
+            for inp in INPUTS:
+                # Show input number and name
+                item = QListWidgetItem(self._ROW_LABELS[inp.number])
+                item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable)
+                # Apply selection made before first open
+                item.setCheckState(
+                    Qt.CheckState.Checked if inp.number in self.selected_items else Qt.CheckState.Unchecked
+                )
+                item.setData(Qt.ItemDataRole.UserRole, inp.number)
+                item.setSizeHint(QSize(self.CELL_WIDTH, self.CELL_HEIGHT))
+                self.items[inp.number] = item
+                self.input_list.addItem(item)
+        finally:
+            self.popup.setUpdatesEnabled(True)
         
-        scroll.setWidget(container)
-        popup_layout.addWidget(scroll)
+        self.input_list.itemChanged.connect(self._on_item_changed)
+        popup_layout.addWidget(self.input_list)
         
         # Initial size - will be resized dynamically when shown
-        self.popup.setMinimumWidth(650)
+        self.popup.setMinimumWidth(_DropdownPopup.WIDTH)
         self.popup.setMinimumHeight(300)
     
     def _toggle_popup(self):
         """Toggle popup visibility"""
+        if self.popup is None:
+            self._create_popup()
+        
         if self.popup.isVisible():
             self.popup.hide()
         else:
-            # Get screen geometry
-            screen = self.window().screen()
-            if screen:
-                screen_rect = screen.availableGeometry()
-                # Set popup to 50% of screen height, centered vertically
-                popup_height = int(screen_rect.height() * 0.5)
-                popup_width = 650
-                
-                self.popup.setFixedHeight(popup_height)
-                self.popup.setFixedWidth(popup_width)
-                
-                # Center horizontally relative to window, center vertically on screen
-                window_center = self.window().mapToGlobal(self.window().rect().center())
-                x = window_center.x() - popup_width // 2
-                y = screen_rect.top() + (screen_rect.height() - popup_height) // 2
-                
-                self.popup.move(x, y)
-            else:
-                # Fallback - position below button
-                pos = self.button.mapToGlobal(self.button.rect().bottomLeft())
-                self.popup.move(pos)
-            
-            self.popup.show()
+            self.popup.show()  # Placement happens in _DropdownPopup.showEvent
+    
+    def _on_item_changed(self, item: QListWidgetItem):
+        self._toggle_one(item.data(Qt.ItemDataRole.UserRole), item.checkState() == Qt.CheckState.Checked)
     
-    def _on_checkbox_changed(self, state):
-        """Handle checkbox state change"""
-        self._update_selection()
+    def _toggle_one(self, input_num: int, checked: bool):
+        """Handle a single row toggle - updates the selection incrementally"""
+        if self._suppress:
+            return
+        if checked:
+            self.selected_items.add(input_num)
+        else:
+            self.selected_items.discard(input_num)
         self._update_button_text()
         self.selection_changed.emit()
     
-    def _update_selection(self):
-        """Update the selected_items list from checkboxes"""
-        self.selected_items = []
-        for input_num, checkbox in self.checkboxes.items():
-            if checkbox.isChecked():
-                self.selected_items.append(input_num)
-    
     def _update_button_text(self):
         """Update button text to show selection summary"""
         if not self.selected_items:
             self.button.setText(self.placeholder)
         elif len(self.selected_items) == 1:
-            inp_num = self.selected_items[0]
-            self.button.setText(f"IN{inp_num:02d} selected")
+            inp_num = next(iter(self.selected_items))
+            self.button.setText(self._SELECTED_LABELS.get(inp_num) or f"IN{inp_num:02d} selected")
         else:
             self.button.setText(f"{len(self.selected_items)} inputs selected")
     
     def get_selected(self) -> List[int]:
         """Get list of selected input numbers"""
-        return self.selected_items.copy()
+        return sorted(self.selected_items)
     
     def set_selected(self, input_numbers: List[int]):
         """Set selected inputs"""
-        self.selected_items = input_numbers.copy() if input_numbers else []
+        self.selected_items = set(input_numbers) if input_numbers else set()
         
-        # Update checkboxes
-        for input_num, checkbox in self.checkboxes.items():
-            checkbox.blockSignals(True)
-            checkbox.setChecked(input_num in self.selected_items)
-            checkbox.blockSignals(False)
+        # Update rows - one flag instead of blocking signals per row
+        self._suppress = True
+        try:
+            for input_num, item in self.items.items():
+                item.setCheckState(
+                    Qt.CheckState.Checked if input_num in self.selected_items else Qt.CheckState.Unchecked
+                )
+        finally:
+            self._suppress = False
         
         self._update_button_text()
     
@@ -232,18 +354,105 @@ class MultiSelectDropdown(QWidget):
         self.set_selected([])
 
 
+class PwmDutyWidget(QWidget):
+    """Single painted widget for a 0-15 PWM duty - a bar plus its percentage text"""
+    
+    valueChanged = pyqtSignal(int)
+    
+    MAX_DUTY = 15
+    TEXT_WIDTH = 45
+    BAR_HEIGHT = 8
+    _LABELS = tuple(f"{int((v / 15) * 100)}%" for v in range(16))  # Percent text per duty
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._duty = self.MAX_DUTY
+        self.setMinimumWidth(100 + self.TEXT_WIDTH)
+        self.setMinimumHeight(24)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+    
+    def duty(self) -> int:
+        return self._duty
+    
+    def setDuty(self, duty: int):
+        duty = max(0, min(self.MAX_DUTY, int(duty)))
+        if duty == self._duty:
+            return
+        self._duty = duty
+        self.update()
+        self.valueChanged.emit(duty)
+    
+    def _bar_width(self) -> int:
+        return max(1, self.width() - self.TEXT_WIDTH - 8)
+    
+    def _duty_at(self, x: float) -> int:
+        return round(x / self._bar_width() * self.MAX_DUTY)
+    
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.setDuty(self._duty_at(event.position().x()))
+            event.accept()
+        else:
+            super().mousePressEvent(event)
+    
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.MouseButton.LeftButton:
+            self.setDuty(self._duty_at(event.position().x()))
+            event.accept()
+        else:
+            super().mouseMoveEvent(event)
+    
+    def keyPressEvent(self, event):
+        key = event.key()
+        if key in (Qt.Key.Key_Left, Qt.Key.Key_Down):
+            self.setDuty(self._duty - 1)
+        elif key in (Qt.Key.Key_Right, Qt.Key.Key_Up):
+            self.setDuty(self._duty + 1)
+        else:
+            super().keyPressEvent(event)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        
+        bar_width = self._bar_width()
+        bar_y = (self.height() - self.BAR_HEIGHT) / 2
+        radius = self.BAR_HEIGHT / 2
+        
+        painter.setBrush(QColor(80, 80, 80, 242))
+        painter.drawRoundedRect(0, int(bar_y), bar_width, self.BAR_HEIGHT, radius, radius)
+        
+        fill_width = int(bar_width * self._duty / self.MAX_DUTY)
+        if fill_width > 0:
+            painter.setBrush(QColor(COLORS['accent_primary']))
+            painter.drawRoundedRect(0, int(bar_y), fill_width, self.BAR_HEIGHT, radius, radius)
+        
+        painter.setPen(QColor(COLORS['text_primary']))
+        painter.drawText(
+            self.width() - self.TEXT_WIDTH, 0, self.TEXT_WIDTH, self.height(),
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, self._LABELS[self._duty]
+        )
+
+
 class OutputConfigWidget(QWidget):
     """Widget for configuring a single output on a device"""
     
     changed = pyqtSignal()
     
+    PWM_EMIT_INTERVAL_MS = 50  # Minimum spacing of changed emits while dragging the duty
+    
     def __init__(self, output_num: int, output_name: str, supports_pwm: bool = True, parent=None):
         super().__init__(parent)
         self.output_num = output_num
         self.output_name = output_name
         self.supports_pwm = supports_pwm
-        self.config = OutputConfig()
-        self.setStyleSheet("background: transparent;")
+        self._pwm_emit_timer = None  # Created on first duty change
+        self._pwm_emit_pending = False
+        self._last_state = None  # (enabled, mode, duty) the slots last acted on
+        self.config = OutputConfig(pwm_duty=PwmDutyWidget.MAX_DUTY)  # Matches the duty widget's default
+        self.setObjectName("outputConfigRow")  # Styled by MAIN_STYLESHEET
         
         self._setup_ui()
     
@@ -255,41 +464,13 @@ class OutputConfigWidget(QWidget):
         # Enable checkbox
         self.enable_check = QCheckBox(self.output_name)
         self.enable_check.setMinimumWidth(140)
-        self.enable_check.setStyleSheet(f"""
-            QCheckBox {{
-                color: {COLORS['text_primary']};
-                font-size: 13px;
-                spacing: 8px;
-                background: transparent;
-            }}
-            QCheckBox::indicator {{
-                width: 20px;
-                height: 20px;
-                border-radius: 4px;
-                border: none;
-                background: rgba(80, 80, 80, 0.95);
-            }}
-            QCheckBox::indicator:checked {{
-                background: {COLORS['accent_primary']};
-            }}
-            QCheckBox::indicator:hover {{
-                background: rgba(100, 100, 100, 1.0);
-            }}
-            QCheckBox::indicator:checked:hover {{
-                background: {COLORS['accent_secondary']};
-            }}
-        """)
-        self.enable_check.stateChanged.connect(self._on_enable_changed)
+        self.enable_check.setObjectName("outputEnableCheck")
+        self.enable_check.toggled.connect(self._on_enable_changed)
         layout.addWidget(self.enable_check)
         
         # Mode card - contains mode dropdown and PWM controls
         self.mode_card = QFrame()
-        self.mode_card.setStyleSheet(f"""
-            QFrame {{
-                background-color: rgba(55, 55, 55, 0.95);
-                border-radius: 8px;
-            }}
-        """)
+        self.mode_card.setObjectName("outputModeCard")
         mode_card_layout = QHBoxLayout(self.mode_card)
         mode_card_layout.setContentsMargins(10, 6, 10, 6)
         mode_card_layout.setSpacing(10)
@@ -300,128 +481,137 @@ class OutputConfigWidget(QWidget):
         self.mode_combo.addItem("Soft-Start", OutputMode.SOFT_START)
         if self.supports_pwm:
             self.mode_combo.addItem("PWM", OutputMode.PWM)
+        self._mode_index = {self.mode_combo.itemData(i): i for i in range(self.mode_combo.count())}
         self.mode_combo.setMinimumWidth(105)
         self.mode_combo.setMinimumHeight(32)
-        self.mode_combo.setStyleSheet(f"""
-            QComboBox {{
-                padding: 4px 10px;
-                font-size: 13px;
-            }}
-        """)
+        self.mode_combo.setObjectName("outputModeCombo")
         self.mode_combo.setEnabled(False)
         self.mode_combo.currentIndexChanged.connect(self._on_mode_changed)
         mode_card_layout.addWidget(self.mode_combo)
         
         # PWM duty cycle
-        self.pwm_label = QLabel("Duty:")
-        self.pwm_label.setStyleSheet("background: transparent;")
-        self.pwm_label.setVisible(False)
-        mode_card_layout.addWidget(self.pwm_label)
-        
-        self.pwm_slider = QSlider(Qt.Orientation.Horizontal)
-        self.pwm_slider.setRange(0, 15)
-        self.pwm_slider.setValue(15)
-        self.pwm_slider.setMinimumWidth(100)
-        self.pwm_slider.setVisible(False)
-        self.pwm_slider.valueChanged.connect(self._on_pwm_changed)
-        mode_card_layout.addWidget(self.pwm_slider)
-        
-        self.pwm_value = QLabel("100%")
-        self.pwm_value.setMinimumWidth(45)
-        self.pwm_value.setStyleSheet("background: transparent;")
-        self.pwm_value.setVisible(False)
-        mode_card_layout.addWidget(self.pwm_value)
+        self.pwm_duty_widget = PwmDutyWidget()
+        self.pwm_duty_widget.setVisible(False)
+        self.pwm_duty_widget.valueChanged.connect(self._on_pwm_changed)
+        mode_card_layout.addWidget(self.pwm_duty_widget)
         
         layout.addWidget(self.mode_card)
         layout.addStretch()
+        
+        # Controls whose signals reset() blocks
+        self._signal_widgets = (self.enable_check, self.mode_combo, self.pwm_duty_widget)
+    
+    def _current_state(self) -> tuple:
+        return (self.enable_check.isChecked(), self.mode_combo.currentData(), self.pwm_duty_widget.duty())
+    
+    def _state_changed(self) -> bool:
+        """Record the current control state, returning False if the slots already acted on it"""
+        state = self._current_state()
+        if state == self._last_state:
+            return False
+        self._last_state = state
+        return True
+    
+    def _update_pwm_visibility(self):
+        show_pwm = (self.mode_combo.currentData() == OutputMode.PWM and self.enable_check.isChecked())
+        self.pwm_duty_widget.setVisible(show_pwm)
     
-    def _on_enable_changed(self, state):
-        enabled = state == Qt.CheckState.Checked.value
+    def _on_enable_changed(self, enabled: bool):
+        if not self._state_changed():
+            return
+        
         self.config.enabled = enabled
         self.mode_combo.setEnabled(enabled)
-        
         if enabled:
-            self._on_mode_changed(self.mode_combo.currentIndex())
+            mode = self.mode_combo.currentData()
+            self.config.mode = mode if mode else OutputMode.TRACK
         else:
-            self.pwm_label.setVisible(False)
-            self.pwm_slider.setVisible(False)
-            self.pwm_value.setVisible(False)
+            self.config.mode = OutputMode.OFF  # A disabled output always reports OFF
         
+        self._update_pwm_visibility()
         self.changed.emit()
     
     def _on_mode_changed(self, index):
-        mode = self.mode_combo.currentData()
-        self.config.mode = mode if mode else OutputMode.TRACK
+        if not self._state_changed():
+            return
         
-        show_pwm = (mode == OutputMode.PWM and self.enable_check.isChecked())
-        self.pwm_label.setVisible(show_pwm)
-        self.pwm_slider.setVisible(show_pwm)
-        self.pwm_value.setVisible(show_pwm)
+        if self.config.enabled:
+            mode = self.mode_combo.currentData()
+            self.config.mode = mode if mode else OutputMode.TRACK
         
+        self._update_pwm_visibility()
         self.changed.emit()
     
     def _on_pwm_changed(self, value):
+        if not self._state_changed():
+            return
+        
         self.config.pwm_duty = value
-        percent = int((value / 15) * 100)
-        self.pwm_value.setText(f"{percent}%")
-        self.changed.emit()
+        
+        # Throttle changed: emit on the first tick, then at most once per
+        # interval, with a trailing emit so the final duty is always reported
+        if self._pwm_emit_timer is None:
+            self._pwm_emit_timer = QTimer(self)
+            self._pwm_emit_timer.setSingleShot(True)
+            self._pwm_emit_timer.setInterval(self.PWM_EMIT_INTERVAL_MS)
+            self._pwm_emit_timer.timeout.connect(self._on_pwm_emit_timeout)
+        
+        if self._pwm_emit_timer.isActive():
+            self._pwm_emit_pending = True
+        else:
+            self.changed.emit()
+            self._pwm_emit_timer.start()
+    
+    def _on_pwm_emit_timeout(self):
+        if self._pwm_emit_pending:
+            self._pwm_emit_pending = False
+            self.changed.emit()
+            self._pwm_emit_timer.start()
     
     def get_config(self) -> OutputConfig:
-        return OutputConfig(
-            enabled=self.enable_check.isChecked(),
-            mode=self.mode_combo.currentData() if self.enable_check.isChecked() else OutputMode.OFF,
-            pwm_duty=self.pwm_slider.value()
-        )
+        """Return the live config - the _on_* slots keep it equal to the controls, no widget reads needed"""
+        return self.config
     
     def set_config(self, config: OutputConfig):
         """Set configuration. Blocks signals to prevent unwanted change events."""
-        # Block signals to prevent cascade of changed events during setup
-        self.enable_check.blockSignals(True)
-        self.mode_combo.blockSignals(True)
-        self.pwm_slider.blockSignals(True)
-        
-        try:
-            self.config = config
+        self._pwm_emit_pending = False  # Drop any trailing emit from a previous drag
+        # Block each control only around its own setter so none of the _on_*
+        # slots run (and none of them emit changed) during a programmatic load
+        with QSignalBlocker(self.enable_check):
             self.enable_check.setChecked(config.enabled)
-            self.mode_combo.setEnabled(config.enabled)
-            
-            idx = self.mode_combo.findData(config.mode)
-            if idx >= 0:
+        self.mode_combo.setEnabled(config.enabled)
+        
+        idx = self._mode_index.get(config.mode, -1)
+        if idx >= 0:
+            with QSignalBlocker(self.mode_combo):
                 self.mode_combo.setCurrentIndex(idx)
-            
-            self.pwm_slider.setValue(config.pwm_duty)
-            
-            # Update PWM visibility manually since we blocked signals
-            show_pwm = (config.mode == OutputMode.PWM and config.enabled)
-            self.pwm_label.setVisible(show_pwm)
-            self.pwm_slider.setVisible(show_pwm)
-            self.pwm_value.setVisible(show_pwm)
-            if show_pwm:
-                percent = int((config.pwm_duty / 15) * 100)
-                self.pwm_value.setText(f"{percent}%")
-        finally:
-            self.enable_check.blockSignals(False)
-            self.mode_combo.blockSignals(False)
-            self.pwm_slider.blockSignals(False)
+        
+        with QSignalBlocker(self.pwm_duty_widget):
+            self.pwm_duty_widget.setDuty(config.pwm_duty)
+        
+        # Own copy so slot mutations never leak into the caller's config
+        self.config = OutputConfig(
+            enabled=config.enabled,
+            mode=self.mode_combo.currentData() if config.enabled else OutputMode.OFF,
+            pwm_duty=self.pwm_duty_widget.duty()
+        )
+        
+        # Update PWM visibility directly since the slots did not run
+        show_pwm = (config.mode == OutputMode.PWM and config.enabled)
+        self.pwm_duty_widget.setVisible(show_pwm)
+        self._last_state = self._current_state()
     
     def reset(self):
         """Reset to default state. Blocks signals to prevent change cascade."""
-        self.enable_check.blockSignals(True)
-        self.mode_combo.blockSignals(True)
-        self.pwm_slider.blockSignals(True)
-        try:
+        self._pwm_emit_pending = False
+        with _signals_blocked(*self._signal_widgets):
             self.enable_check.setChecked(False)
             self.mode_combo.setEnabled(False)
             self.mode_combo.setCurrentIndex(0)
-            self.pwm_slider.setValue(15)
-            self.pwm_label.setVisible(False)
-            self.pwm_slider.setVisible(False)
-            self.pwm_value.setVisible(False)
-            self.config = OutputConfig()
-        finally:
-            self.enable_check.blockSignals(False)
-            self.mode_combo.blockSignals(False)
-            self.pwm_slider.blockSignals(False)
+            self.pwm_duty_widget.setDuty(PwmDutyWidget.MAX_DUTY)
+            self.pwm_duty_widget.setVisible(False)
+            self.config = OutputConfig(pwm_duty=PwmDutyWidget.MAX_DUTY)
+            self._last_state = self._current_state()
 
 
 class DeviceOutputsWidget(QWidget):
@@ -433,10 +623,17 @@ class DeviceOutputsWidget(QWidget):
         super().__init__(parent)
         self.device = device
         self.output_widgets = []
+        self._widgets_by_num = {}  # output_num -> OutputConfigWidget
+        self._touched_nums = set()  # Outputs that may differ from their reset state
         self.show_header = show_header
         self._enabled = False
         
-        self._setup_ui()
+        # Build all output rows before any layout or paint pass
+        self.setUpdatesEnabled(False)
+        try:
+            self._setup_ui()
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -448,12 +645,12 @@ class DeviceOutputsWidget(QWidget):
             header_layout = QHBoxLayout()
             self.device_check = QCheckBox(self.device.name)
             self.device_check.setFont(QFont("", 11, QFont.Weight.Bold))
-            self.device_check.stateChanged.connect(self._on_device_toggled)
+            self.device_check.toggled.connect(self._on_device_toggled)
             header_layout.addWidget(self.device_check)
             
             pgn = f"0x{self.device.pgn_high:02X}{self.device.pgn_low:02X}"
             pgn_label = QLabel(f"(PGN {pgn})")
-            pgn_label.setStyleSheet(f"color: {COLORS['text_muted']};")
+            pgn_label.setObjectName("pgnLabel")
             header_layout.addWidget(pgn_label)
             header_layout.addStretch()
             layout.addLayout(header_layout)
@@ -464,39 +661,41 @@ class DeviceOutputsWidget(QWidget):
         
         # Outputs container
         self.outputs_container = QWidget()
-        self.outputs_container.setStyleSheet("background: transparent;")
+        self.outputs_container.setObjectName("deviceOutputsContainer")
         outputs_layout = QVBoxLayout(self.outputs_container)
         outputs_layout.setContentsMargins(0 if not self.show_header else 20, 4, 0, 4)
         outputs_layout.setSpacing(4)
         
         # Label for selecting outputs
         outputs_label = QLabel("Check the outputs you want to control:")
-        outputs_label.setStyleSheet(f"color: {COLORS['accent_primary']}; font-weight: 700; font-size: 13px; margin-bottom: 8px; background: transparent;")
+        outputs_label.setObjectName("deviceOutputsLabel")
         outputs_layout.addWidget(outputs_label)
         
         # Create output widgets
-        for i, output_name in enumerate(self.device.outputs):
+        for i, (output_name, supports_pwm) in enumerate(zip(self.device.outputs, self.device.pwm_mask)):
             output_num = i + 1
-            supports_pwm = (self.device.device_type == "powercell" and output_num <= 8)
-            
             widget = OutputConfigWidget(output_num, output_name, supports_pwm)
+            widget.changed.connect(lambda n=output_num: self._touched_nums.add(n))
             widget.changed.connect(self.changed)
             self.output_widgets.append(widget)
+            self._widgets_by_num[output_num] = widget
             outputs_layout.addWidget(widget)
         
+        # Parent the container before showing it - a parentless visible
+        # widget would open as its own window and take activation
+        layout.addWidget(self.outputs_container)
         # Show outputs immediately if no header
         self.outputs_container.setVisible(not self.show_header)
-        layout.addWidget(self.outputs_container)
     
-    def _on_device_toggled(self, state):
-        enabled = state == Qt.CheckState.Checked.value
+    def _on_device_toggled(self, enabled: bool):
         self._enabled = enabled
         if self.show_header:
             self.outputs_container.setVisible(enabled)
         
         if not enabled:
-            for widget in self.output_widgets:
-                widget.reset()
+            for output_num in self._touched_nums:
+                self._widgets_by_num[output_num].reset()
+            self._touched_nums = set()
         
         self.changed.emit()
     
@@ -507,9 +706,8 @@ class DeviceOutputsWidget(QWidget):
         """Enable/disable this device (used when no header)"""
         self._enabled = enabled
         # Block signals to prevent change cascade
-        self.device_check.blockSignals(True)
-        self.device_check.setChecked(enabled)
-        self.device_check.blockSignals(False)
+        with QSignalBlocker(self.device_check):
+            self.device_check.setChecked(enabled)
         if not self.show_header:
             self.outputs_container.setVisible(enabled)
     
@@ -523,30 +721,30 @@ class DeviceOutputsWidget(QWidget):
     
     def set_output_configs(self, configs: dict):
         """Set output configurations. Blocks signals to prevent change cascade."""
-        # Block signals during setup
-        self.device_check.blockSignals(True)
-        try:
+        with _signals_blocked(self, self.device_check):
             has_any = len(configs) > 0
             self.device_check.setChecked(has_any)
             
-            for widget in self.output_widgets:
-                if widget.output_num in configs:
-                    widget.set_config(configs[widget.output_num])
-                else:
-                    widget.reset()
-        finally:
-            self.device_check.blockSignals(False)
+            # Only outputs being loaded or possibly edited need touching
+            loaded = set()
+            for output_num, config in configs.items():
+                widget = self._widgets_by_num.get(output_num)
+                if widget is not None:
+                    widget.set_config(config)
+                    loaded.add(output_num)
+            
+            for output_num in self._touched_nums - loaded:
+                self._widgets_by_num[output_num].reset()
+            self._touched_nums = loaded
     
     def reset(self):
         """Reset to default state. Blocks signals to prevent change cascade."""
-        self.device_check.blockSignals(True)
-        try:
+        with QSignalBlocker(self.device_check):
             self.device_check.setChecked(False)
             self._enabled = False
-            for widget in self.output_widgets:
-                widget.reset()
-        finally:
-            self.device_check.blockSignals(False)
+            for output_num in self._touched_nums:
+                self._widgets_by_num[output_num].reset()
+            self._touched_nums = set()
 
 
 class CaseEditor(QWidget):
@@ -554,52 +752,64 @@ class CaseEditor(QWidget):
     
     changed = pyqtSignal()
     
-    # Master stylesheet with all states - set once, never changed
-    _MASTER_STYLESHEET = None
-    _HEADER_EXPANDED_STYLE = None
+    CHANGED_EMIT_INTERVAL_MS = 50  # Minimum spacing of changed emits during bursts of edits
+    
+    # Timer result texts per (value, 10s scale) - every 6-bit value, formatted once
+    _DELAY_RESULT_TEXTS = {
+        (value, scale_10s): _format_timer_result(value, scale_10s, "= 0s")
+        for value in range(64) for scale_10s in (False, True)
+    }
+    _ON_RESULT_TEXTS = {
+        (value, scale_10s): _format_timer_result(value, scale_10s, "= 0s (∞)")
+        for value in range(64) for scale_10s in (False, True)
+    }
+    
+    # Item models shared by every editor's fixed-content combos
+    _MODE_MODEL = None
+    _PATTERN_MODEL = None
+    _TIMER_EXEC_MODEL = None
+    _TIMER_SCALE_MODEL = None
+    _IGNITION_MODE_MODEL = None
+    # {item data: row} for each shared model, so set_config needs no findData scans
+    _MODE_INDEX = None
+    _PATTERN_INDEX = None
+    _TIMER_EXEC_INDEX = None
+    _TIMER_SCALE_INDEX = None
+    _IGNITION_MODE_INDEX = None
+    
+    @staticmethod
+    def _build_combo_model(entries):
+        """Create an item model from (text, data) pairs; returns (model, {data: row})"""
+        model = QStandardItemModel()
+        index = {}
+        for row, (text, data) in enumerate(entries):
+            item = QStandardItem(text)
+            item.setData(data, Qt.ItemDataRole.UserRole)
+            model.appendRow(item)
+            index[data] = row
+        return model, index
     
     @classmethod
-    def _init_master_styles(cls):
-        """Initialize master stylesheet once - uses property selectors for state"""
-        if cls._MASTER_STYLESHEET is None:
-            cls._MASTER_STYLESHEET = f"""
-                CaseEditor[caseState="disabled"] {{
-                    background-color: {COLORS['bg_dark']};
-                    border: 1px solid {COLORS['border_default']};
-                    border-radius: 8px;
-                }}
-                CaseEditor[caseState="disabled"]:hover {{
-                    border-color: {COLORS['text_muted']};
-                }}
-                CaseEditor[caseState="enabled"] {{
-                    background-color: {COLORS['bg_light']};
-                    border: 2px solid {COLORS['accent_green']};
-                    border-radius: 8px;
-                }}
-                CaseEditor[caseState="enabled"]:hover {{
-                    border-color: {COLORS['accent_blue']};
-                }}
-                CaseEditor[caseState="has_data"] {{
-                    background-color: {COLORS['bg_dark']};
-                    border: 2px solid {COLORS['accent_orange']};
-                    border-radius: 8px;
-                }}
-                CaseEditor[caseState="has_data"]:hover {{
-                    border-color: {COLORS['accent_yellow']};
-                }}
-                CaseEditor[caseState="expanded"] {{
-                    background-color: {COLORS['bg_medium']};
-                    border: 2px solid {COLORS['accent_blue']};
-                    border-radius: 8px;
-                }}
-            """
-            cls._HEADER_EXPANDED_STYLE = f"""
-                QFrame {{
-                    background-color: {COLORS['bg_light']};
-                    border-top-left-radius: 6px;
-                    border-top-right-radius: 6px;
-                }}
-            """
+    def _init_shared_models(cls):
+        """Build the fixed combo models once - combos only reference them"""
+        if cls._MODE_MODEL is None:
+            cls._MODE_MODEL, cls._MODE_INDEX = cls._build_combo_model(
+                (("Track", "track"), ("Toggle", "toggle"), ("Timed", "timed"))
+            )
+            cls._PATTERN_MODEL, cls._PATTERN_INDEX = cls._build_combo_model(
+                (preset['name'], key) for key, preset in PATTERN_PRESETS.items()
+            )
+            cls._TIMER_EXEC_MODEL, cls._TIMER_EXEC_INDEX = cls._build_combo_model(
+                (("Fire-and-Forget", "fire_and_forget"), ("Track Input", "track_input"))
+            )
+            # False = 0.25s scale, True = 10s scale; shared by both timer scale combos
+            cls._TIMER_SCALE_MODEL, cls._TIMER_SCALE_INDEX = cls._build_combo_model(
+                (("× 0.25s", False), ("× 10s", True))
+            )
+            cls._IGNITION_MODE_MODEL, cls._IGNITION_MODE_INDEX = cls._build_combo_model(
+                (("Normal", "normal"), ("Sets Ignition", "set_ignition"),
+                 ("Tracks Ignition", "track_ignition"))
+            )
     
     def __init__(self, case_type: str, case_index: int, parent=None):
         super().__init__(parent)
@@ -608,16 +818,27 @@ class CaseEditor(QWidget):
         self.device_widgets = {}
         self.is_expanded = False
         self.is_default = False  # Track if case was loaded from preset
-        self._stored_config = None  # Store config when enabled
         self._cached_style_state = None  # Track current style state
-        
-        # Initialize class-level styles once
-        CaseEditor._init_master_styles()
-        
-        # Set master stylesheet once - never changes
-        self.setStyleSheet(CaseEditor._MASTER_STYLESHEET)
-        
-        self._setup_ui()
+        self._header_expanded = False  # headerExpanded property last applied to the header
+        self._cached_config = None  # Last built CaseConfig, cleared on any change
+        self._has_data_cache = None  # Last _has_configured_data() result, cleared with the config
+        self._changed_timer = None  # Created on first throttled edit
+        self._changed_pending = False
+        self._is_cleared = True  # Showing the reset() state, untouched since
+        
+        # Every internal edit funnels through self.changed - connect the cache
+        # invalidation first so it runs before any external listener reads config
+        self.changed.connect(self._invalidate_cache)
+        
+        # Initialize class-level combo models once
+        CaseEditor._init_shared_models()
+        
+        # Build all child widgets before any layout or paint pass
+        self.setUpdatesEnabled(False)
+        try:
+            self._setup_ui()
+        finally:
+            self.setUpdatesEnabled(True)
         self._update_style()
     
     def _setup_ui(self):
@@ -626,7 +847,9 @@ class CaseEditor(QWidget):
         self.main_layout.setContentsMargins(0, 0, 0, 0)
         
         # Header (always visible) - clickable
-        self.header = QFrame()
+        self.header = _ClickableFrame()
+        self.header.setObjectName("caseHeader")  # Expanded style via the headerExpanded property
+        self.header.clicked.connect(self._on_header_clicked)
         self.header.setCursor(Qt.CursorShape.PointingHandCursor)
         header_layout = QHBoxLayout(self.header)
         header_layout.setContentsMargins(12, 10, 12, 10)
@@ -635,43 +858,13 @@ class CaseEditor(QWidget):
         case_label = f"{self.case_type.upper()} Case {self.case_index + 1}"
         self.enable_check = QCheckBox(case_label)
         self.enable_check.setFont(QFont("", 12, QFont.Weight.Bold))
-        self.enable_check.setStyleSheet(f"""
-            QCheckBox {{
-                color: {COLORS['text_primary']};
-                spacing: 10px;
-                background: transparent;
-            }}
-            QCheckBox::indicator {{
-                width: 22px;
-                height: 22px;
-                border-radius: 5px;
-                border: 2px solid rgba(100, 100, 100, 0.8);
-                background: rgba(60, 60, 60, 0.9);
-            }}
-            QCheckBox::indicator:hover {{
-                border-color: {COLORS['accent_blue']};
-                background: rgba(80, 80, 80, 1.0);
-            }}
-            QCheckBox::indicator:checked {{
-                background: {COLORS['accent_green']};
-                border-color: {COLORS['accent_green']};
-            }}
-            QCheckBox::indicator:checked:hover {{
-                background: {COLORS['accent_primary']};
-                border-color: {COLORS['accent_primary']};
-            }}
-        """)
-        self.enable_check.stateChanged.connect(self._on_enable_changed)
+        self.enable_check.setObjectName("caseEnableCheck")
+        self.enable_check.toggled.connect(self._on_enable_changed)
         header_layout.addWidget(self.enable_check, alignment=Qt.AlignmentFlag.AlignVCenter)
         
         # Default label (italicized, shown when case was loaded from preset)
         self.default_label = QLabel("default")
-        self.default_label.setStyleSheet(f"""
-            color: {COLORS['text_muted']};
-            font-style: italic;
-            font-size: 11px;
-            background: transparent;
-        """)
+        self.default_label.setObjectName("caseDefaultLabel")
         self.default_label.setVisible(False)
         header_layout.addWidget(self.default_label, alignment=Qt.AlignmentFlag.AlignVCenter)
         
@@ -679,23 +872,7 @@ class CaseEditor(QWidget):
         
         # Clear button - explicitly clears case data
         self.clear_btn = QPushButton("Clear")
-        self.clear_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: rgba(70, 70, 70, 0.9);
-                color: {COLORS['text_secondary']};
-                border: none;
-                border-radius: 5px;
-                font-size: 11px;
-                font-weight: 600;
-                padding: 4px 10px;
-                min-width: 50px;
-                max-width: 50px;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['danger']};
-                color: white;
-            }}
-        """)
+        self.clear_btn.setObjectName("caseClearButton")
         self.clear_btn.clicked.connect(self._on_clear_clicked)
         self.clear_btn.setVisible(False)  # Only show when case has data
         header_layout.addWidget(self.clear_btn)
@@ -704,11 +881,27 @@ class CaseEditor(QWidget):
         header_layout.addSpacing(16)
         
         self.expand_label = QLabel("▶")
-        self.expand_label.setStyleSheet(f"color: {COLORS['text_muted']}; background: transparent;")
+        self.expand_label.setObjectName("expandLabel")
         header_layout.addWidget(self.expand_label)
         
         self.main_layout.addWidget(self.header)
         
+        # Content is built on first expand or non-default load - see _ensure_content
+        self.content = None
+        # Controls whose signals must be blocked during a programmatic load -
+        # extended with the content controls once they exist
+        self._signal_widgets = (self.enable_check,)
+    
+    def _ensure_content(self):
+        """Build the configuration widgets the first time they are needed"""
+        if self.content is None:
+            self.setUpdatesEnabled(False)
+            try:
+                self._build_content()
+            finally:
+                self.setUpdatesEnabled(True)
+    
+    def _build_content(self):
         # Content (hidden by default) - full configuration interface
         self.content = QWidget()
         content_layout = QVBoxLayout(self.content)
@@ -721,7 +914,7 @@ class CaseEditor(QWidget):
         
         device_label = QLabel("Device:")
         device_label.setFont(QFont("", 11, QFont.Weight.Bold))
-        device_label.setStyleSheet(f"color: {COLORS['accent_blue']};")
+        device_label.setObjectName("devicesHeader")
         device_row.addWidget(device_label)
         
         self.device_combo = QComboBox()
@@ -730,14 +923,7 @@ class CaseEditor(QWidget):
             self.device_combo.addItem(f"{device.name}", device_id)
         self.device_combo.setMinimumWidth(220)
         self.device_combo.setMinimumHeight(36)
-        self.device_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: rgba(55, 55, 55, 0.95);
-                padding: 6px 12px;
-                border-radius: 8px;
-                font-size: 13px;
-            }}
-        """)
+        self.device_combo.setObjectName("caseCardCombo")
         self.device_combo.currentIndexChanged.connect(self._on_device_changed)
         device_row.addWidget(self.device_combo)
         device_row.addStretch()
@@ -749,21 +935,14 @@ class CaseEditor(QWidget):
         self.outputs_layout.setSpacing(8)
         self.outputs_layout.setContentsMargins(0, 8, 0, 0)
         
-        # Create device widgets but keep them hidden initially
-        for device_id, device in DEVICES.items():
-            widget = DeviceOutputsWidget(device, show_header=False)
-            widget.changed.connect(self.changed)
-            widget.setVisible(False)
-            self.device_widgets[device_id] = widget
-            self.outputs_layout.addWidget(widget)
-        
+        # Device widgets are built on first selection - see _get_device_widget
         content_layout.addWidget(self.outputs_container)
         
         # Separator
         sep = QFrame()
         sep.setFrameShape(QFrame.Shape.HLine)
         sep.setFixedHeight(1)
-        sep.setStyleSheet(f"background-color: {COLORS['border_default']};")
+        sep.setObjectName("caseSeparator")
         content_layout.addWidget(sep)
         
         # Settings row - all in one horizontal layout
@@ -772,49 +951,30 @@ class CaseEditor(QWidget):
         
         # Mode label
         mode_label = QLabel("Mode:")
-        mode_label.setStyleSheet("background: transparent;")
         settings_layout.addWidget(mode_label)
         
         # Mode dropdown with card
         self.mode_combo = QComboBox()
-        self.mode_combo.addItem("Track", "track")
-        self.mode_combo.addItem("Toggle", "toggle")
-        self.mode_combo.addItem("Timed", "timed")
+        self.mode_combo.setModel(CaseEditor._MODE_MODEL)
         self.mode_combo.setMinimumWidth(130)
         self.mode_combo.setMinimumHeight(36)
-        self.mode_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: rgba(55, 55, 55, 0.95);
-                padding: 6px 12px;
-                border-radius: 8px;
-                font-size: 13px;
-            }}
-        """)
-        self.mode_combo.currentIndexChanged.connect(lambda: self.changed.emit())
+        self.mode_combo.setObjectName("caseCardCombo")
+        self.mode_combo.currentIndexChanged.connect(self._emit_changed)
         settings_layout.addWidget(self.mode_combo)
         
         settings_layout.addSpacing(16)
         
         # Pattern label
         pattern_label = QLabel("Pattern:")
-        pattern_label.setStyleSheet("background: transparent;")
         settings_layout.addWidget(pattern_label)
         
         # Pattern dropdown with card
         self.pattern_combo = QComboBox()
-        for key, preset in PATTERN_PRESETS.items():
-            self.pattern_combo.addItem(preset['name'], key)
+        self.pattern_combo.setModel(CaseEditor._PATTERN_MODEL)
         self.pattern_combo.setMinimumWidth(160)
         self.pattern_combo.setMinimumHeight(36)
-        self.pattern_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: rgba(55, 55, 55, 0.95);
-                padding: 6px 12px;
-                border-radius: 8px;
-                font-size: 13px;
-            }}
-        """)
-        self.pattern_combo.currentIndexChanged.connect(lambda: self.changed.emit())
+        self.pattern_combo.setObjectName("caseCardCombo")
+        self.pattern_combo.currentIndexChanged.connect(self._emit_changed)
         settings_layout.addWidget(self.pattern_combo)
         
         settings_layout.addStretch()
@@ -828,28 +988,19 @@ class CaseEditor(QWidget):
         exec_mode_layout.setSpacing(12)
         
         exec_label = QLabel("Timer Behavior:")
-        exec_label.setStyleSheet("background: transparent;")
         exec_label.setToolTip("How timers respond if input changes before completion")
         exec_mode_layout.addWidget(exec_label)
         
         self.timer_exec_mode_combo = QComboBox()
-        self.timer_exec_mode_combo.addItem("Fire-and-Forget", "fire_and_forget")
-        self.timer_exec_mode_combo.addItem("Track Input", "track_input")
+        self.timer_exec_mode_combo.setModel(CaseEditor._TIMER_EXEC_MODEL)
         self.timer_exec_mode_combo.setMinimumWidth(160)
         self.timer_exec_mode_combo.setMinimumHeight(36)
         self.timer_exec_mode_combo.setToolTip(
             "Fire-and-Forget: Timer runs to completion regardless of input state\n"
             "Track Input: Timer cancels if input turns OFF"
         )
-        self.timer_exec_mode_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: rgba(55, 55, 55, 0.95);
-                padding: 6px 12px;
-                border-radius: 8px;
-                font-size: 13px;
-            }}
-        """)
-        self.timer_exec_mode_combo.currentIndexChanged.connect(lambda: self.changed.emit())
+        self.timer_exec_mode_combo.setObjectName("caseCardCombo")
+        self.timer_exec_mode_combo.currentIndexChanged.connect(self._emit_changed)
         exec_mode_layout.addWidget(self.timer_exec_mode_combo)
         
         exec_mode_layout.addStretch()
@@ -861,7 +1012,6 @@ class CaseEditor(QWidget):
         
         # Timer Delay (delay before sending ON message)
         delay_label = QLabel("Delay:")
-        delay_label.setStyleSheet("background: transparent;")
         delay_label.setToolTip("Delay before sending ON message")
         timers_layout.addWidget(delay_label)
         
@@ -870,35 +1020,23 @@ class CaseEditor(QWidget):
         self.timer_delay_spin.setValue(0)
         self.timer_delay_spin.setMinimumWidth(70)
         self.timer_delay_spin.setMinimumHeight(36)
-        self.timer_delay_spin.setStyleSheet(f"""
-            QSpinBox {{
-                background-color: rgba(55, 55, 55, 0.95);
-                padding: 6px 12px;
-                border-radius: 8px;
-                font-size: 13px;
-            }}
-        """)
-        self.timer_delay_spin.valueChanged.connect(self._update_timer_display)
+        self.timer_delay_spin.setObjectName("caseCardSpin")
+        self.timer_delay_spin.setKeyboardTracking(False)  # Typed values apply on Enter/focus-out, not per digit
+        self.timer_delay_spin.valueChanged.connect(self._update_delay_result)
+        self.timer_delay_spin.valueChanged.connect(self._emit_changed)
         timers_layout.addWidget(self.timer_delay_spin)
         
         self.timer_delay_scale_combo = QComboBox()
-        self.timer_delay_scale_combo.addItem("× 0.25s", False)  # False = 0.25s scale
-        self.timer_delay_scale_combo.addItem("× 10s", True)     # True = 10s scale
+        self.timer_delay_scale_combo.setModel(CaseEditor._TIMER_SCALE_MODEL)
         self.timer_delay_scale_combo.setMinimumWidth(90)
         self.timer_delay_scale_combo.setMinimumHeight(36)
-        self.timer_delay_scale_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: rgba(55, 55, 55, 0.95);
-                padding: 6px 12px;
-                border-radius: 8px;
-                font-size: 13px;
-            }}
-        """)
-        self.timer_delay_scale_combo.currentIndexChanged.connect(self._update_timer_display)
+        self.timer_delay_scale_combo.setObjectName("caseCardCombo")
+        self.timer_delay_scale_combo.currentIndexChanged.connect(self._update_delay_result)
+        self.timer_delay_scale_combo.currentIndexChanged.connect(self._emit_changed)
         timers_layout.addWidget(self.timer_delay_scale_combo)
         
         self.timer_delay_result = QLabel("= 0s")
-        self.timer_delay_result.setStyleSheet(f"color: {COLORS['text_muted']}; background: transparent;")
+        self.timer_delay_result.setObjectName("timerResultLabel")
         self.timer_delay_result.setMinimumWidth(80)
         timers_layout.addWidget(self.timer_delay_result)
         
@@ -906,7 +1044,6 @@ class CaseEditor(QWidget):
         
         # Timer On (how long ON state lasts)
         timer_on_label = QLabel("Duration:")
-        timer_on_label.setStyleSheet("background: transparent;")
         timer_on_label.setToolTip("How long to stay ON before auto-OFF (0=indefinite)")
         timers_layout.addWidget(timer_on_label)
         
@@ -915,35 +1052,23 @@ class CaseEditor(QWidget):
         self.timer_on_spin.setValue(0)
         self.timer_on_spin.setMinimumWidth(70)
         self.timer_on_spin.setMinimumHeight(36)
-        self.timer_on_spin.setStyleSheet(f"""
-            QSpinBox {{
-                background-color: rgba(55, 55, 55, 0.95);
-                padding: 6px 12px;
-                border-radius: 8px;
-                font-size: 13px;
-            }}
-        """)
-        self.timer_on_spin.valueChanged.connect(self._update_timer_display)
+        self.timer_on_spin.setObjectName("caseCardSpin")
+        self.timer_on_spin.setKeyboardTracking(False)
+        self.timer_on_spin.valueChanged.connect(self._update_on_result)
+        self.timer_on_spin.valueChanged.connect(self._emit_changed)
         timers_layout.addWidget(self.timer_on_spin)
         
         self.timer_on_scale_combo = QComboBox()
-        self.timer_on_scale_combo.addItem("× 0.25s", False)  # False = 0.25s scale
-        self.timer_on_scale_combo.addItem("× 10s", True)     # True = 10s scale
+        self.timer_on_scale_combo.setModel(CaseEditor._TIMER_SCALE_MODEL)
         self.timer_on_scale_combo.setMinimumWidth(90)
         self.timer_on_scale_combo.setMinimumHeight(36)
-        self.timer_on_scale_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: rgba(55, 55, 55, 0.95);
-                padding: 6px 12px;
-                border-radius: 8px;
-                font-size: 13px;
-            }}
-        """)
-        self.timer_on_scale_combo.currentIndexChanged.connect(self._update_timer_display)
+        self.timer_on_scale_combo.setObjectName("caseCardCombo")
+        self.timer_on_scale_combo.currentIndexChanged.connect(self._update_on_result)
+        self.timer_on_scale_combo.currentIndexChanged.connect(self._emit_changed)
         timers_layout.addWidget(self.timer_on_scale_combo)
         
-        self.timer_on_result = QLabel("= 0s")
-        self.timer_on_result.setStyleSheet(f"color: {COLORS['text_muted']}; background: transparent;")
+        self.timer_on_result = QLabel("= 0s (∞)")  # 0 = no time limit
+        self.timer_on_result.setObjectName("timerResultLabel")
         self.timer_on_result.setMinimumWidth(80)
         timers_layout.addWidget(self.timer_on_result)
         
@@ -956,84 +1081,31 @@ class CaseEditor(QWidget):
         
         # Ignition Mode dropdown
         ignition_mode_label = QLabel("Ignition Mode:")
-        ignition_mode_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 11px;")
+        ignition_mode_label.setObjectName("ignitionModeLabel")
         options_layout.addWidget(ignition_mode_label)
         
         self.ignition_mode_combo = QComboBox()
         self.ignition_mode_combo.setMinimumWidth(140)
-        self.ignition_mode_combo.setStyleSheet(f"""
-            QComboBox {{
-                background: rgba(70, 70, 70, 0.9);
-                color: {COLORS['text_primary']};
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 6px;
-                padding: 4px 8px;
-                font-size: 11px;
-            }}
-            QComboBox:hover {{
-                border: 1px solid {COLORS['accent_blue']};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            QComboBox QAbstractItemView {{
-                background: rgba(50, 50, 50, 0.95);
-                color: {COLORS['text_primary']};
-                selection-background-color: {COLORS['accent_blue']};
-            }}
-        """)
-        self.ignition_mode_combo.addItem("Normal", "normal")
-        self.ignition_mode_combo.addItem("Sets Ignition", "set_ignition")
-        self.ignition_mode_combo.addItem("Tracks Ignition", "track_ignition")
+        self.ignition_mode_combo.setObjectName("ignitionModeCombo")
+        self.ignition_mode_combo.setModel(CaseEditor._IGNITION_MODE_MODEL)
         self.ignition_mode_combo.setToolTip(
             "Normal: No special ignition behavior\n"
             "Sets Ignition: This input IS the ignition source (typically IN01)\n"
             "Tracks Ignition: Case auto-activates when ignition is ON"
         )
-        self.ignition_mode_combo.currentIndexChanged.connect(lambda: self.changed.emit())
+        self.ignition_mode_combo.currentIndexChanged.connect(self._emit_changed)
         options_layout.addWidget(self.ignition_mode_combo)
         
         self.can_override_check = QCheckBox("Can Be Overridden")
         self.can_override_check.setToolTip("For single-filament brake lights: allows turn signals to override")
-        self.can_override_check.setStyleSheet(f"""
-            QCheckBox {{
-                color: {COLORS['text_primary']};
-                spacing: 6px;
-                background: transparent;
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                background: rgba(70, 70, 70, 0.9);
-            }}
-            QCheckBox::indicator:checked {{
-                background: {COLORS['accent_orange']};
-            }}
-        """)
-        self.can_override_check.stateChanged.connect(lambda: self.changed.emit())
+        self.can_override_check.setObjectName("canOverrideCheck")
+        self.can_override_check.stateChanged.connect(self._emit_changed)
         options_layout.addWidget(self.can_override_check)
         
         self.require_ignition_check = QCheckBox("Requires Ignition")
         self.require_ignition_check.setToolTip("Case only activates when ignition is ON")
-        self.require_ignition_check.setStyleSheet(f"""
-            QCheckBox {{
-                color: {COLORS['text_primary']};
-                spacing: 6px;
-                background: transparent;
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                background: rgba(70, 70, 70, 0.9);
-            }}
-            QCheckBox::indicator:checked {{
-                background: {COLORS['accent_blue']};
-            }}
-        """)
-        self.require_ignition_check.stateChanged.connect(lambda: self.changed.emit())
+        self.require_ignition_check.setObjectName("requireIgnitionCheck")
+        self.require_ignition_check.stateChanged.connect(self._emit_changed)
         options_layout.addWidget(self.require_ignition_check)
         
         options_layout.addStretch()
@@ -1050,7 +1122,7 @@ class CaseEditor(QWidget):
         must_on_layout.addWidget(must_on_label)
         
         self.must_on_dropdown = MultiSelectDropdown("None selected")
-        self.must_on_dropdown.selection_changed.connect(self.changed)
+        self.must_on_dropdown.selection_changed.connect(self._emit_changed)
         must_on_layout.addWidget(self.must_on_dropdown)
         must_on_layout.addStretch()
         conditions_layout.addLayout(must_on_layout)
@@ -1062,7 +1134,7 @@ class CaseEditor(QWidget):
         must_off_layout.addWidget(must_off_label)
         
         self.must_off_dropdown = MultiSelectDropdown("None selected")
-        self.must_off_dropdown.selection_changed.connect(self.changed)
+        self.must_off_dropdown.selection_changed.connect(self._emit_changed)
         must_off_layout.addWidget(self.must_off_dropdown)
         must_off_layout.addStretch()
         conditions_layout.addLayout(must_off_layout)
@@ -1072,18 +1144,22 @@ class CaseEditor(QWidget):
         
         self.content.setVisible(False)
         self.main_layout.addWidget(self.content)
+        
+        self._signal_widgets = (
+            self.enable_check, self.device_combo, self.mode_combo,
+            self.pattern_combo, self.timer_exec_mode_combo, self.timer_delay_spin,
+            self.timer_delay_scale_combo, self.timer_on_spin, self.timer_on_scale_combo,
+            self.ignition_mode_combo, self.can_override_check, self.require_ignition_check
+        )
     
     def _update_style(self):
         """Update visual style based on state. Uses property selectors for fast switching."""
-        is_enabled = self.enable_check.isChecked()
-        has_data = self._has_configured_data()
-        
-        # Determine the style state
+        # Determine the style state - only a collapsed, disabled case needs the data check
         if self.is_expanded:
             new_state = 'expanded'
-        elif is_enabled:
+        elif self.enable_check.isChecked():
             new_state = 'enabled'
-        elif has_data:
+        elif self._has_configured_data():
             new_state = 'has_data'
         else:
             new_state = 'disabled'
@@ -1096,27 +1172,29 @@ class CaseEditor(QWidget):
             self.setProperty('caseState', new_state)
             self.style().unpolish(self)
             self.style().polish(self)
-            
-            # Update expand arrow and header
-            if new_state == 'expanded':
-                self.expand_label.setText("▼")
-                self.header.setStyleSheet(CaseEditor._HEADER_EXPANDED_STYLE)
-            else:
-                self.expand_label.setText("▶")
-                self.header.setStyleSheet("")
-    
-    def _on_enable_changed(self, state):
-        enabled = state == Qt.CheckState.Checked.value
         
+        # Expand arrow and header only differ between expanded and everything
+        # else - e.g. enabled <-> has_data leaves them alone
+        header_expanded = new_state == 'expanded'
+        if header_expanded != self._header_expanded:
+            self._header_expanded = header_expanded
+            self.expand_label.setText("▼" if header_expanded else "▶")
+            self.header.setProperty('headerExpanded', header_expanded)
+            self.header.style().unpolish(self.header)
+            self.header.style().polish(self.header)
+    
+    def _on_enable_changed(self, enabled: bool):
         if enabled:
             # Expanding - show content
             self.is_expanded = True
+            self._ensure_content()
             self.content.setVisible(True)
         else:
             # Disabling - just collapse, DON'T clear data
             # User must explicitly click Clear to remove data
             self.is_expanded = False
-            self.content.setVisible(False)
+            if self.content is not None:
+                self.content.setVisible(False)
         
         self._update_style()
         self._update_clear_button_visibility()
@@ -1124,29 +1202,37 @@ class CaseEditor(QWidget):
     
     def _on_clear_clicked(self):
         """Explicitly clear all case data when user clicks Clear button"""
-        reply = QMessageBox.question(
-            self, 
-            "Clear Case", 
+        # Window-modal via open() rather than a nested event loop; the result arrives in finished
+        box = QMessageBox(
+            QMessageBox.Icon.Question,
+            "Clear Case",
             f"Are you sure you want to clear all data for {self.case_type.upper()} Case {self.case_index + 1}?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
+            self
         )
+        box.setDefaultButton(QMessageBox.StandardButton.No)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.finished.connect(self._on_clear_confirmed)
+        box.open()
+    
+    def _on_clear_confirmed(self, result: int):
+        if result != QMessageBox.StandardButton.Yes.value:
+            return
         
-        if reply == QMessageBox.StandardButton.Yes:
-            # Disable and clear
-            self.enable_check.blockSignals(True)
+        # Disable and clear
+        with QSignalBlocker(self.enable_check):
             self.enable_check.setChecked(False)
-            self.enable_check.blockSignals(False)
-            
-            self.is_expanded = False
+        
+        self.is_expanded = False
+        if self.content is not None:
             self.content.setVisible(False)
             self._clear_to_empty()
-            self.is_default = False
-            self.default_label.setVisible(False)
-            
-            self._update_style()
-            self._update_clear_button_visibility()
-            self.changed.emit()
+        self.is_default = False
+        self.default_label.setVisible(False)
+        
+        self._update_style()
+        self._update_clear_button_visibility()
+        self.changed.emit()
     
     def _update_clear_button_visibility(self):
         """Show Clear button only when case has data configured"""
@@ -1154,7 +1240,15 @@ class CaseEditor(QWidget):
         self.clear_btn.setVisible(has_data)
     
     def _has_configured_data(self) -> bool:
-        """Check if this case has any data configured"""
+        """Check if this case has any data configured - cached until the next _invalidate_cache()"""
+        if self._has_data_cache is None:
+            self._has_data_cache = self._compute_has_configured_data()
+        return self._has_data_cache
+    
+    def _compute_has_configured_data(self) -> bool:
+        if self.content is None:
+            return False  # Unbuilt content only ever holds defaults
+        
         # Check if any device has configured outputs
         selected_device_id = self.device_combo.currentData()
         if selected_device_id and selected_device_id in self.device_widgets:
@@ -1164,102 +1258,128 @@ class CaseEditor(QWidget):
                 return True
         
         # Check if conditions are set
-        if self.must_on_dropdown.get_selected() or self.must_off_dropdown.get_selected():
+        if self.must_on_dropdown.selected_items or self.must_off_dropdown.selected_items:
             return True
         
         return False
     
     def _clear_to_empty(self):
         """Clear all configuration to empty state"""
-        self.device_combo.setCurrentIndex(0)  # "Select a device..."
-        for widget in self.device_widgets.values():
-            widget.setVisible(False)
-            widget.reset()
-        self.mode_combo.setCurrentIndex(0)
-        self.pattern_combo.setCurrentIndex(0)
-        # Clear timer configuration
-        self.timer_exec_mode_combo.setCurrentIndex(0)  # Fire-and-Forget
-        self.timer_delay_spin.setValue(0)
-        self.timer_delay_scale_combo.setCurrentIndex(0)  # 0.25s
-        self.timer_on_spin.setValue(0)
-        self.timer_on_scale_combo.setCurrentIndex(0)  # 0.25s
-        self.timer_delay_result.setText("= 0s")
-        self.timer_on_result.setText("= 0s (∞)")
-        # Clear option flags
-        self.ignition_mode_combo.setCurrentIndex(0)  # Normal
-        self.can_override_check.setChecked(False)
-        self.require_ignition_check.setChecked(False)
-        self.must_on_dropdown.clear_selection()
-        self.must_off_dropdown.clear_selection()
+        # One layout and paint pass for the whole clear (the device combo
+        # change below also swaps device widgets)
+        with _updates_disabled(self):
+            self._invalidate_cache()
+            self.device_combo.setCurrentIndex(0)  # "Select a device..."
+            for widget in self.device_widgets.values():
+                widget.setVisible(False)
+                widget.reset()
+            self.mode_combo.setCurrentIndex(0)
+            self.pattern_combo.setCurrentIndex(0)
+            # Clear timer configuration
+            self.timer_exec_mode_combo.setCurrentIndex(0)  # Fire-and-Forget
+            self.timer_delay_spin.setValue(0)
+            self.timer_delay_scale_combo.setCurrentIndex(0)  # 0.25s
+            self.timer_on_spin.setValue(0)
+            self.timer_on_scale_combo.setCurrentIndex(0)  # 0.25s
+            self.timer_delay_result.setText("= 0s")
+            self.timer_on_result.setText("= 0s (∞)")
+            # Clear option flags
+            self.ignition_mode_combo.setCurrentIndex(0)  # Normal
+            self.can_override_check.setChecked(False)
+            self.require_ignition_check.setChecked(False)
+            self.must_on_dropdown.clear_selection()
+            self.must_off_dropdown.clear_selection()
+    
+    def _get_device_widget(self, device_id: str):
+        """Return the outputs widget for a device, building it the first time it is needed"""
+        widget = self.device_widgets.get(device_id)
+        if widget is None and device_id in DEVICES:
+            widget = DeviceOutputsWidget(DEVICES[device_id], show_header=False)
+            widget.changed.connect(self._emit_changed)
+            self.device_widgets[device_id] = widget
+            self.outputs_layout.addWidget(widget)
+        return widget
     
     def _on_device_changed(self, index):
         """Show only the outputs for the selected device"""
         selected_device_id = self.device_combo.currentData()
         
-        # Hide all device widgets, show only the selected one
-        for device_id, widget in self.device_widgets.items():
-            if device_id == selected_device_id:
-                widget.setVisible(True)
-                widget.set_enabled(True)  # Auto-enable outputs section
-            else:
-                widget.setVisible(False)
-                widget.reset()  # Reset hidden devices
+        # Swap device widgets in one layout pass rather than repainting per widget
+        with _updates_disabled(self):
+            if selected_device_id:
+                self._get_device_widget(selected_device_id)
+            
+            # Hide all device widgets, show only the selected one
+            for device_id, widget in self.device_widgets.items():
+                if device_id == selected_device_id:
+                    widget.setVisible(True)
+                    widget.set_enabled(True)  # Auto-enable outputs section
+                else:
+                    widget.setVisible(False)
+                    widget.reset()  # Reset hidden devices
         
         self.changed.emit()
     
-    def _update_timer_display(self):
-        """Update the calculated timer duration labels"""
-        # Calculate delay duration
-        delay_value = self.timer_delay_spin.value()
-        delay_scale_10s = self.timer_delay_scale_combo.currentData()
-        if delay_scale_10s:
-            delay_seconds = delay_value * 10.0
-        else:
-            delay_seconds = delay_value * 0.25
-        
-        if delay_seconds == 0:
-            self.timer_delay_result.setText("= 0s")
-        elif delay_seconds >= 60:
-            minutes = delay_seconds / 60
-            self.timer_delay_result.setText(f"= {minutes:.1f}m")
-        else:
-            self.timer_delay_result.setText(f"= {delay_seconds:.2g}s")
-        
-        # Calculate timer on duration
-        on_value = self.timer_on_spin.value()
-        on_scale_10s = self.timer_on_scale_combo.currentData()
-        if on_scale_10s:
-            on_seconds = on_value * 10.0
+    def _on_header_clicked(self):
+        """Toggle expansion on header click"""
+        # Only expand/collapse if already enabled, otherwise toggle enable
+        if self.enable_check.isChecked():
+            # Toggle expansion only
+            self.is_expanded = not self.is_expanded
+            self._is_cleared = False
+            if self.is_expanded:
+                self._ensure_content()
+            if self.content is not None:
+                self.content.setVisible(self.is_expanded)
+            self._update_style()
         else:
-            on_seconds = on_value * 0.25
-        
-        if on_seconds == 0:
-            self.timer_on_result.setText("= 0s (∞)")
-        elif on_seconds >= 60:
-            minutes = on_seconds / 60
-            self.timer_on_result.setText(f"= {minutes:.1f}m")
+            # Enable and expand
+            self.enable_check.setChecked(True)
+    
+    @pyqtSlot()
+    def _emit_changed(self):
+        """Emit changed for an edit, at most once per interval with a trailing emit for the last edit"""
+        self._invalidate_cache()  # Readers between emits must still see the edit
+        if self._changed_timer is None:
+            self._changed_timer = QTimer(self)
+            self._changed_timer.setSingleShot(True)
+            self._changed_timer.setInterval(self.CHANGED_EMIT_INTERVAL_MS)
+            self._changed_timer.timeout.connect(self._on_changed_timeout)
+        
+        if self._changed_timer.isActive():
+            self._changed_pending = True
         else:
-            self.timer_on_result.setText(f"= {on_seconds:.2g}s")
-        
-        self.changed.emit()
+            self.changed.emit()
+            self._changed_timer.start()
     
-    def mousePressEvent(self, event):
-        """Toggle expansion on header click"""
-        if self.header.geometry().contains(event.pos()):
-            # Only expand/collapse if already enabled, otherwise toggle enable
-            if self.enable_check.isChecked():
-                # Toggle expansion only
-                self.is_expanded = not self.is_expanded
-                self.content.setVisible(self.is_expanded)
-                self._update_style()
-            else:
-                # Enable and expand
-                self.enable_check.setChecked(True)
-        super().mousePressEvent(event)
+    def _on_changed_timeout(self):
+        if self._changed_pending:
+            self._changed_pending = False
+            self.changed.emit()
+            self._changed_timer.start()
+    
+    def flush_pending_changes(self):
+        """Emit a held-back changed now, e.g. before the panel switches to another input"""
+        if self._changed_pending:
+            self._changed_pending = False
+            self.changed.emit()
+    
+    def _invalidate_cache(self):
+        """Drop the cached CaseConfig and has-data flag so both are recomputed on next use"""
+        self._cached_config = None
+        self._has_data_cache = None
+        self._is_cleared = False  # Every edit and load passes through here
     
     def get_config(self) -> CaseConfig:
+        if self._cached_config is not None:
+            return self._cached_config
+        
         config = CaseConfig()
         config.enabled = self.enable_check.isChecked()
+        if self.content is None:
+            # Never built, so every other setting is still at its default
+            self._cached_config = config
+            return config
         
         # Save ALL current values regardless of whether they've been "changed"
         config.device_outputs = []
@@ -1298,25 +1418,24 @@ class CaseEditor(QWidget):
         config.must_be_on = self.must_on_dropdown.get_selected()
         config.must_be_off = self.must_off_dropdown.get_selected()
         
+        self._cached_config = config
         return config
     
     def set_config(self, config: CaseConfig, is_default: bool = False):
         """Set configuration. is_default=True when loaded from preset file."""
-        # Block signals during setup to prevent change cascade
-        self.enable_check.blockSignals(True)
-        self.device_combo.blockSignals(True)
-        self.mode_combo.blockSignals(True)
-        self.pattern_combo.blockSignals(True)
-        self.timer_exec_mode_combo.blockSignals(True)
-        self.timer_delay_spin.blockSignals(True)
-        self.timer_delay_scale_combo.blockSignals(True)
-        self.timer_on_spin.blockSignals(True)
-        self.timer_on_scale_combo.blockSignals(True)
-        self.ignition_mode_combo.blockSignals(True)
-        self.can_override_check.blockSignals(True)
-        self.require_ignition_check.blockSignals(True)
+        self._apply_config(config, is_default)
+        self._update_style()
+        self._update_clear_button_visibility()
+    
+    def _apply_config(self, config: CaseConfig, is_default: bool):
+        """Write config into the controls, leaving header style/clear button to the caller"""
+        self._changed_pending = False  # Drop any trailing emit from before the load
+        self._invalidate_cache()
+        if not config.has_default_settings():
+            self._ensure_content()
         
-        try:
+        # Block signals during setup (ours included) to prevent change cascade
+        with _signals_blocked(self, *self._signal_widgets):
             self.enable_check.setChecked(config.enabled)
             
             # Set default flag and show label if this is a preset-loaded config
@@ -1325,6 +1444,9 @@ class CaseEditor(QWidget):
             
             # Keep collapsed when loading - user clicks to expand
             self.is_expanded = False
+            if self.content is None:
+                # Nothing beyond the enabled flag to show - leave the content unbuilt
+                return
             self.content.setVisible(False)
             
             device_output_dict = dict(config.device_outputs) if config.device_outputs else {}
@@ -1339,42 +1461,46 @@ class CaseEditor(QWidget):
             else:
                 self.device_combo.setCurrentIndex(0)  # "Select a device..."
             
-            for device_id, widget in self.device_widgets.items():
-                if device_id in device_output_dict:
-                    widget.setVisible(True)
-                    widget.set_enabled(True)
-                    widget.set_output_configs(device_output_dict[device_id])
-                else:
-                    widget.setVisible(False)
-                    widget.reset()
+            with _updates_disabled(self):
+                for device_id in device_output_dict:
+                    self._get_device_widget(device_id)
+                
+                for device_id, widget in self.device_widgets.items():
+                    if device_id in device_output_dict:
+                        widget.setVisible(True)
+                        widget.set_enabled(True)
+                        widget.set_output_configs(device_output_dict[device_id])
+                    else:
+                        widget.setVisible(False)
+                        widget.reset()
             
-            idx = self.mode_combo.findData(config.mode)
-            if idx >= 0:
+            idx = self._MODE_INDEX.get(config.mode)
+            if idx is not None:
                 self.mode_combo.setCurrentIndex(idx)
             
-            idx = self.pattern_combo.findData(config.pattern_preset)
-            if idx >= 0:
+            idx = self._PATTERN_INDEX.get(config.pattern_preset)
+            if idx is not None:
                 self.pattern_combo.setCurrentIndex(idx)
             
             # Set timer configuration
             # Execution mode
             exec_mode = getattr(config, 'timer_execution_mode', 'fire_and_forget')
-            idx = self.timer_exec_mode_combo.findData(exec_mode)
-            if idx >= 0:
+            idx = self._TIMER_EXEC_INDEX.get(exec_mode)
+            if idx is not None:
                 self.timer_exec_mode_combo.setCurrentIndex(idx)
             
             # Timer Delay
             self.timer_delay_spin.setValue(getattr(config, 'timer_delay_value', 0))
             delay_scale_10s = getattr(config, 'timer_delay_scale_10s', False)
-            idx = self.timer_delay_scale_combo.findData(delay_scale_10s)
-            if idx >= 0:
+            idx = self._TIMER_SCALE_INDEX.get(delay_scale_10s)
+            if idx is not None:
                 self.timer_delay_scale_combo.setCurrentIndex(idx)
             
             # Timer On (duration)
             self.timer_on_spin.setValue(getattr(config, 'timer_on_value', 0))
             on_scale_10s = getattr(config, 'timer_on_scale_10s', False)
-            idx = self.timer_on_scale_combo.findData(on_scale_10s)
-            if idx >= 0:
+            idx = self._TIMER_SCALE_INDEX.get(on_scale_10s)
+            if idx is not None:
                 self.timer_on_scale_combo.setCurrentIndex(idx)
             
             # Update timer display labels
@@ -1385,132 +1511,50 @@ class CaseEditor(QWidget):
             # Handle legacy set_ignition field
             if ignition_mode == 'normal' and getattr(config, 'set_ignition', False):
                 ignition_mode = 'set_ignition'
-            idx = self.ignition_mode_combo.findData(ignition_mode)
-            if idx >= 0:
-                self.ignition_mode_combo.setCurrentIndex(idx)
-            else:
-                self.ignition_mode_combo.setCurrentIndex(0)  # Default to Normal
+            # Default to Normal
+            self.ignition_mode_combo.setCurrentIndex(self._IGNITION_MODE_INDEX.get(ignition_mode, 0))
             
             self.can_override_check.setChecked(getattr(config, 'can_be_overridden', False))
             self.require_ignition_check.setChecked(getattr(config, 'require_ignition_on', False))
             
             self.must_on_dropdown.set_selected(config.must_be_on or [])
             self.must_off_dropdown.set_selected(config.must_be_off or [])
-            
-            self._update_style()
-            self._update_clear_button_visibility()
-        finally:
-            # Always unblock signals
-            self.enable_check.blockSignals(False)
-            self.device_combo.blockSignals(False)
-            self.mode_combo.blockSignals(False)
-            self.pattern_combo.blockSignals(False)
-            self.timer_exec_mode_combo.blockSignals(False)
-            self.timer_delay_spin.blockSignals(False)
-            self.timer_delay_scale_combo.blockSignals(False)
-            self.timer_on_spin.blockSignals(False)
-            self.timer_on_scale_combo.blockSignals(False)
-            self.ignition_mode_combo.blockSignals(False)
-            self.can_override_check.blockSignals(False)
-            self.require_ignition_check.blockSignals(False)
     
     def _update_timer_labels_only(self):
         """Update timer display labels without emitting changed signal"""
-        # Calculate delay duration
-        delay_value = self.timer_delay_spin.value()
-        delay_scale_10s = self.timer_delay_scale_combo.currentData()
-        if delay_scale_10s:
-            delay_seconds = delay_value * 10.0
-        else:
-            delay_seconds = delay_value * 0.25
-        
-        if delay_seconds == 0:
-            self.timer_delay_result.setText("= 0s")
-        elif delay_seconds >= 60:
-            minutes = delay_seconds / 60
-            self.timer_delay_result.setText(f"= {minutes:.1f}m")
-        else:
-            self.timer_delay_result.setText(f"= {delay_seconds:.2g}s")
-        
-        # Calculate timer on duration
-        on_value = self.timer_on_spin.value()
-        on_scale_10s = self.timer_on_scale_combo.currentData()
-        if on_scale_10s:
-            on_seconds = on_value * 10.0
-        else:
-            on_seconds = on_value * 0.25
-        
-        if on_seconds == 0:
-            self.timer_on_result.setText("= 0s (∞)")
-        elif on_seconds >= 60:
-            minutes = on_seconds / 60
-            self.timer_on_result.setText(f"= {minutes:.1f}m")
-        else:
-            self.timer_on_result.setText(f"= {on_seconds:.2g}s")
+        self._update_delay_result()
+        self._update_on_result()
+    
+    def _update_delay_result(self):
+        self.timer_delay_result.setText(self._DELAY_RESULT_TEXTS[
+            (self.timer_delay_spin.value(), bool(self.timer_delay_scale_combo.currentData()))
+        ])
+    
+    def _update_on_result(self):
+        self.timer_on_result.setText(self._ON_RESULT_TEXTS[
+            (self.timer_on_spin.value(), bool(self.timer_on_scale_combo.currentData()))
+        ])
     
     def reset(self):
         """Reset to empty disabled state. Blocks signals to prevent change cascade."""
-        # Block signals during reset
-        self.enable_check.blockSignals(True)
-        self.device_combo.blockSignals(True)
-        self.mode_combo.blockSignals(True)
-        self.pattern_combo.blockSignals(True)
-        self.timer_exec_mode_combo.blockSignals(True)
-        self.timer_delay_spin.blockSignals(True)
-        self.timer_delay_scale_combo.blockSignals(True)
-        self.timer_on_spin.blockSignals(True)
-        self.timer_on_scale_combo.blockSignals(True)
-        self.ignition_mode_combo.blockSignals(True)
-        self.can_override_check.blockSignals(True)
-        self.require_ignition_check.blockSignals(True)
+        if self._is_cleared:
+            return  # Nothing edited or loaded since the last reset
         
-        try:
+        self._changed_pending = False
+        self._invalidate_cache()
+        with _signals_blocked(*self._signal_widgets):
             self.enable_check.setChecked(False)
             
             self.is_default = False
             self.default_label.setVisible(False)
             self.is_expanded = False
-            self.content.setVisible(False)
-            
-            self.device_combo.setCurrentIndex(0)  # "Select a device..."
-            for widget in self.device_widgets.values():
-                widget.setVisible(False)
-                widget.reset()
-            self.mode_combo.setCurrentIndex(0)
-            self.pattern_combo.setCurrentIndex(0)
-            
-            # Reset timer configuration
-            self.timer_exec_mode_combo.setCurrentIndex(0)  # Fire-and-Forget
-            self.timer_delay_spin.setValue(0)
-            self.timer_delay_scale_combo.setCurrentIndex(0)  # 0.25s
-            self.timer_on_spin.setValue(0)
-            self.timer_on_scale_combo.setCurrentIndex(0)  # 0.25s
-            self.timer_delay_result.setText("= 0s")
-            self.timer_on_result.setText("= 0s (∞)")
-            
-            # Reset option flags
-            self.ignition_mode_combo.setCurrentIndex(0)  # Normal
-            self.can_override_check.setChecked(False)
-            self.require_ignition_check.setChecked(False)
-            
-            self.must_on_dropdown.clear_selection()
-            self.must_off_dropdown.clear_selection()
+            if self.content is not None:
+                self.content.setVisible(False)
+                self._clear_to_empty()
             
             self._update_style()
             self._update_clear_button_visibility()
-        finally:
-            self.enable_check.blockSignals(False)
-            self.device_combo.blockSignals(False)
-            self.mode_combo.blockSignals(False)
-            self.pattern_combo.blockSignals(False)
-            self.timer_exec_mode_combo.blockSignals(False)
-            self.timer_delay_spin.blockSignals(False)
-            self.timer_delay_scale_combo.blockSignals(False)
-            self.timer_on_spin.blockSignals(False)
-            self.timer_on_scale_combo.blockSignals(False)
-            self.ignition_mode_combo.blockSignals(False)
-            self.can_override_check.blockSignals(False)
-            self.require_ignition_check.blockSignals(False)
+        self._is_cleared = True
 
 
 class InputConfigPanel(QWidget):
@@ -1525,6 +1569,9 @@ class InputConfigPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_input = None
+        # True while the editors hold an empty config that nobody has edited since
+        self._last_set_empty = False
+        self.changed.connect(self._on_edited)
         self._setup_ui()
     
     def _setup_ui(self):
@@ -1571,36 +1618,43 @@ class InputConfigPanel(QWidget):
         # ON Cases section
         self.on_label = QLabel("ON Cases")
         self.on_label.setFont(QFont("", 12, QFont.Weight.Bold))
-        self.on_label.setStyleSheet(f"color: {COLORS['accent_green']};")
+        self.on_label.setObjectName("onSectionLabel")
         self.scroll_layout.addWidget(self.on_label)
         
+        # Case editors are created on first use by _ensure_editors() and
+        # inserted right after their section label
         self.on_case_editors = []
-        for i in range(self.MAX_ON_CASES):
-            editor = CaseEditor('on', i)
-            editor.changed.connect(self.changed)
-            self.on_case_editors.append(editor)
-            self.scroll_layout.addWidget(editor)
         
         # OFF Cases section
         self.off_label = QLabel("OFF Cases")
         self.off_label.setFont(QFont("", 12, QFont.Weight.Bold))
-        self.off_label.setStyleSheet(f"color: {COLORS['accent_red']}; margin-top: 16px;")
+        self.off_label.setObjectName("offSectionLabel")
         self.scroll_layout.addWidget(self.off_label)
         
         self.off_case_editors = []
-        for i in range(self.MAX_OFF_CASES):
-            editor = CaseEditor('off', i)
-            editor.changed.connect(self.changed)
-            self.off_case_editors.append(editor)
-            self.scroll_layout.addWidget(editor)
         
         self.scroll_layout.addStretch()
         self.scroll.setWidget(self.scroll_content)
         layout.addWidget(self.scroll)
     
+    def _ensure_editors(self, case_type: str, count: int):
+        """Create case editors of case_type until there are count of them"""
+        if case_type == 'on':
+            editors, label, limit = self.on_case_editors, self.on_label, self.MAX_ON_CASES
+        else:
+            editors, label, limit = self.off_case_editors, self.off_label, self.MAX_OFF_CASES
+        
+        for i in range(len(editors), min(count, limit)):
+            editor = CaseEditor(case_type, i)
+            editor.changed.connect(self.changed)
+            editors.append(editor)
+            self.scroll_layout.insertWidget(self.scroll_layout.indexOf(label) + 1 + i, editor)
+    
     def _update_case_visibility(self, input_number: int):
         """Show/hide case editors based on the input's actual case counts."""
         on_count, off_count = get_case_counts(input_number)
+        self._ensure_editors('on', on_count)
+        self._ensure_editors('off', off_count)
         
         # Update case count label
         if off_count > 0:
@@ -1641,49 +1695,91 @@ class InputConfigPanel(QWidget):
         if not self.current_input:
             return InputConfig(input_number=1)
         
-        config = InputConfig(input_number=self.current_input.number)
-        config.custom_name = self.custom_name_edit.text()
-        
         # Get case counts for this input
         on_count, off_count = get_case_counts(self.current_input.number)
         
-        # Only get configs from visible case editors
-        for i in range(min(on_count, len(self.on_case_editors))):
-            config.on_cases[i] = self.on_case_editors[i].get_config()
-        
-        for i in range(min(off_count, len(self.off_case_editors))):
-            config.off_cases[i] = self.off_case_editors[i].get_config()
-        
-        return config
+        # Only get configs from visible case editors. Passing the lists in
+        # means InputConfig does not build default cases just to replace them.
+        return InputConfig(
+            input_number=self.current_input.number,
+            custom_name=self.custom_name_edit.text(),
+            on_cases=[editor.get_config() for editor in self.on_case_editors[:on_count]],
+            off_cases=[editor.get_config() for editor in self.off_case_editors[:off_count]]
+        )
+    
+    def _on_edited(self):
+        self._last_set_empty = False
+    
+    def flush_pending_changes(self):
+        """Deliver edits the case editors are still holding back"""
+        for editor in self.on_case_editors + self.off_case_editors:
+            editor.flush_pending_changes()
     
     def set_config(self, config: InputConfig, is_default: bool = False):
         """Set configuration. is_default=True marks cases loaded from preset."""
-        self.custom_name_edit.blockSignals(True)
-        self.custom_name_edit.setText(config.custom_name)
-        self.custom_name_edit.blockSignals(False)
-        
-        # Get case counts for this input
-        input_number = config.input_number
-        on_count, off_count = get_case_counts(input_number)
-        
-        # Set case configs for visible editors only
-        for i in range(min(on_count, len(self.on_case_editors), len(config.on_cases))):
-            self.on_case_editors[i].set_config(config.on_cases[i], is_default=is_default)
+        is_empty = config.is_empty()
+        if is_empty and self._last_set_empty:
+            # Editors already show an untouched empty config; hidden ones are
+            # reset by set_input(), so there is nothing left to write
+            return
+        self._last_set_empty = is_empty
         
-        for i in range(min(off_count, len(self.off_case_editors), len(config.off_cases))):
-            self.off_case_editors[i].set_config(config.off_cases[i], is_default=is_default)
+        # Programmatic load - nothing changed from the user's point of view
+        with _signals_blocked(self, self.custom_name_edit):
+            self.custom_name_edit.setText(config.custom_name)
+            
+            # Get case counts for this input
+            input_number = config.input_number
+            on_count, off_count = get_case_counts(input_number)
+            
+            # Set case configs for visible editors only: write every editor's
+            # controls first, then refresh header styles in a second pass
+            loaded = []
+            for editors, cases, count in ((self.on_case_editors, config.on_cases, on_count),
+                                          (self.off_case_editors, config.off_cases, off_count)):
+                for editor, case in zip(editors[:count], cases):
+                    editor._apply_config(case, is_default)
+                    loaded.append(editor)
+            
+            for editor in loaded:
+                editor._update_style()
+                editor._update_clear_button_visibility()
 
 
 class InputsPage(QWidget):
     """Input configuration with master-detail layout"""
     
+    COMMIT_DELAY_MS = 120  # Quiet time after the last panel edit before it is stored
+    
     def __init__(self, config: FullConfiguration, parent=None):
         super().__init__(parent)
         self.config = config
         self.current_input_number = None
         self.is_preset_loaded = False  # Track if config came from preset
+        self._configured_inputs = set()  # Input numbers with at least one enabled case
+        self._list_items = {}  # Input number -> its permanent QListWidgetItem
+        self._suppress_count = 0  # Nesting depth of batch_updates()
+        self._pending_changed = False  # A panel edit arrived while suppressed
+        # Panel edits are stored once typing/clicking pauses, not per keystroke
+        self._commit_timer = QTimer(self)
+        self._commit_timer.setSingleShot(True)
+        self._commit_timer.setInterval(self.COMMIT_DELAY_MS)
+        self._commit_timer.timeout.connect(self._commit_current_config)
+        self._rebuild_configured_cache()
         self._setup_ui()
     
+    @contextmanager
+    def batch_updates(self):
+        """Defer panel change handling until the outermost block exits, then apply it once"""
+        self._suppress_count += 1
+        try:
+            yield
+        finally:
+            self._suppress_count -= 1
+            if self._suppress_count == 0 and self._pending_changed:
+                self._pending_changed = False
+                self._on_config_changed()
+    
     def _setup_ui(self):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -1722,6 +1818,7 @@ class InputsPage(QWidget):
         left_layout.addLayout(filter_layout)
         
         self.input_list = QListWidget()
+        self.input_list.setUniformItemSizes(True)  # Every row is one line of the same font
         self.input_list.currentRowChanged.connect(self._on_input_selected)
         left_layout.addWidget(self.input_list)
         
@@ -1741,113 +1838,181 @@ class InputsPage(QWidget):
         if self.input_list.count() > 0:
             self.input_list.setCurrentRow(0)
     
-    def _populate_input_list(self, filter_type: str = "all"):
-        self.input_list.clear()
-        
+    @staticmethod
+    def _has_enabled_case(input_config: InputConfig) -> bool:
+        """True if any ON or OFF case of the input is enabled"""
+        return (any(c.enabled for c in input_config.on_cases)
+                or any(c.enabled for c in input_config.off_cases))
+    
+    def _rebuild_configured_cache(self):
+        """Recompute the set of configured inputs from the full configuration"""
+        self._configured_inputs = {
+            i + 1 for i, input_config in enumerate(self.config.inputs)
+            if self._has_enabled_case(input_config)
+        }
+    
+    def _update_configured_cache(self, input_number: int):
+        """Refresh the configured flag of a single input after it was edited"""
+        if self._has_enabled_case(self.config.inputs[input_number - 1]):
+            self._configured_inputs.add(input_number)
+        else:
+            self._configured_inputs.discard(input_number)
+    
+    def _build_input_rows(self, filter_type: str) -> list:
+        """Compute (text, input_number, has_config, shown) rows for every input - touches no widgets"""
+        rows = []
+        inputs = self.config.inputs
+        configured = self._configured_inputs
+        icon_configured = ICONS['input_configured']
+        icon_empty = ICONS['input_empty']
         for inp in INPUTS:
-            if filter_type == "ground" and inp.input_type != "ground":
-                continue
-            if filter_type == "high_side" and inp.input_type != "high_side":
-                continue
-            if filter_type == "configured":
-                input_config = self.config.inputs[inp.number - 1]
-                if not any(c.enabled for c in input_config.on_cases + input_config.off_cases):
-                    continue
-            
-            input_config = self.config.inputs[inp.number - 1]
-            has_config = any(c.enabled for c in input_config.on_cases + input_config.off_cases)
-            
-            icon = ICONS['input_configured'] if has_config else ICONS['input_empty']
-            display_name = input_config.custom_name if input_config.custom_name else inp.name
-            
-            item = QListWidgetItem(f"{icon} IN{inp.number:02d}: {display_name}")
-            item.setData(Qt.ItemDataRole.UserRole, inp.number)
-            
-            if has_config:
-                item.setForeground(Qt.GlobalColor.white)
+            has_config = inp.number in configured
+            if filter_type in ("ground", "high_side"):
+                shown = inp.input_type == filter_type
+            elif filter_type == "configured":
+                shown = has_config
             else:
-                item.setForeground(Qt.GlobalColor.gray)
+                shown = True
             
-            self.input_list.addItem(item)
+            input_config = inputs[inp.number - 1]
+            icon = icon_configured if has_config else icon_empty
+            display_name = input_config.custom_name if input_config.custom_name else inp.name
+            rows.append((f"{icon} IN{inp.number:02d}: {display_name}", inp.number, has_config, shown))
+        return rows
+    
+    def _populate_input_list(self, filter_type: str = "all"):
+        """Refresh the list items in place; the filter hides rows rather than removing them"""
+        input_list = self.input_list
+        # Repopulating drops the selection; currentRowChanged(-1) would only
+        # save the shown input, so do that directly (before the rows are built)
+        if input_list.currentRow() >= 0:
+            self.save_current_input()
+        
+        rows = self._build_input_rows(filter_type)
+        list_items = self._list_items
+        user_role = Qt.ItemDataRole.UserRole
+        white = Qt.GlobalColor.white
+        gray = Qt.GlobalColor.gray
+        
+        # Update all items in one pass without repainting or signals between them
+        input_list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(input_list):
+                input_list.setCurrentRow(-1)
+                for text, input_number, has_config, shown in rows:
+                    item = list_items.get(input_number)
+                    if item is None:
+                        item = QListWidgetItem()
+                        item.setData(user_role, input_number)
+                        input_list.addItem(item)
+                        list_items[input_number] = item
+                    item.setText(text)
+                    item.setForeground(white if has_config else gray)
+                    item.setHidden(not shown)
+        finally:
+            input_list.setUpdatesEnabled(True)
+    
+    def _first_shown_row(self) -> int:
+        """Row of the first input the filter leaves visible, or -1"""
+        input_list = self.input_list
+        for row in range(input_list.count()):
+            if not input_list.item(row).isHidden():
+                return row
+        return -1
     
     def _apply_filter(self, index):
         filter_type = self.filter_combo.currentData()
         self._populate_input_list(filter_type)
     
     def _on_input_selected(self, row):
-        # Save current before switching
-        self.save_current_input()
-        
-        if row < 0:
-            return
-        
-        item = self.input_list.item(row)
-        if not item:
-            return
-        
-        input_number = item.data(Qt.ItemDataRole.UserRole)
-        input_def = get_input_definition(input_number)
-        
-        if input_def:
-            self.current_input_number = input_number
-            # Disable UI updates during the switch to prevent lag
-            self.config_panel.setUpdatesEnabled(False)
-            try:
+        # One updates-disabled window over the save and the switch, so the
+        # panel is repainted once with the new input
+        with _updates_disabled(self.config_panel):
+            # Save current before switching
+            self.save_current_input()
+            
+            if row < 0:
+                return
+            
+            item = self.input_list.item(row)
+            if not item:
+                return
+            
+            input_number = item.data(Qt.ItemDataRole.UserRole)
+            input_def = get_input_definition(input_number)
+            
+            if input_def:
+                self.current_input_number = input_number
                 self.config_panel.set_input(input_def)
                 self.config_panel.set_config(
                     self.config.inputs[input_number - 1],
                     is_default=self.is_preset_loaded
                 )
-            finally:
-                self.config_panel.setUpdatesEnabled(True)
     
     def _on_config_changed(self):
+        if self.current_input_number:
+            if self._suppress_count:
+                self._pending_changed = True
+                return
+            self._commit_timer.start()
+    
+    def _commit_current_config(self):
+        """Store the panel's config for the current input and refresh its list row"""
         if self.current_input_number:
             config = self.config_panel.get_config()
             self.config.inputs[self.current_input_number - 1] = config
+            self._update_configured_cache(self.current_input_number)
             self._update_list_item(self.current_input_number)
     
     def _update_list_item(self, input_number: int):
-        for i in range(self.input_list.count()):
-            item = self.input_list.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) == input_number:
-                input_config = self.config.inputs[input_number - 1]
-                input_def = get_input_definition(input_number)
-                
-                if input_def:
-                    has_config = any(c.enabled for c in input_config.on_cases + input_config.off_cases)
-                    icon = ICONS['input_configured'] if has_config else ICONS['input_empty']
-                    display_name = input_config.custom_name if input_config.custom_name else input_def.name
-                    
-                    item.setText(f"{icon} IN{input_number:02d}: {display_name}")
-                    
-                    if has_config:
-                        item.setForeground(Qt.GlobalColor.white)
-                    else:
-                        item.setForeground(Qt.GlobalColor.gray)
-                break
+        input_def = get_input_definition(input_number)
+        if not input_def:
+            return
+        
+        item = self._list_items.get(input_number)
+        if item is None:
+            return
+        
+        input_config = self.config.inputs[input_number - 1]
+        has_config = input_number in self._configured_inputs
+        icon = ICONS['input_configured'] if has_config else ICONS['input_empty']
+        display_name = input_config.custom_name if input_config.custom_name else input_def.name
+        
+        item.setText(f"{icon} IN{input_number:02d}: {display_name}")
+        item.setForeground(Qt.GlobalColor.white if has_config else Qt.GlobalColor.gray)
     
     def save_current_input(self):
         """Save current input configuration"""
-        if self.current_input_number:
+        # Throttled editor edits must reach _on_config_changed while this input is current
+        self.config_panel.flush_pending_changes()
+        if self._commit_timer.isActive():
+            # An edit is still waiting - store it now, list row included
+            self._commit_timer.stop()
+            self._commit_current_config()
+        elif self.current_input_number:
             self.config.inputs[self.current_input_number - 1] = self.config_panel.get_config()
+            self._update_configured_cache(self.current_input_number)
     
     def set_configuration(self, config: FullConfiguration, is_preset: bool = False):
         """Set the full configuration. is_preset=True marks cases as 'default'."""
         # Store the new configuration
         self.config = config
         self.current_input_number = None
+        self._commit_timer.stop()  # Edits waiting for the old configuration are dropped with it
         self.is_preset_loaded = is_preset
+        self._rebuild_configured_cache()
         
-        # Reset the config panel to clear any stale state from previous configuration
-        self._reset_config_panel()
-        
-        # Repopulate the list with new configuration data
-        self._populate_input_list(self.filter_combo.currentData() or "all")
-        
-        # Auto-select first input (Input 1) - this will load the new config for input 1
-        if self.input_list.count() > 0:
-            self.input_list.setCurrentRow(0)
+        with self.batch_updates():
+            # Repopulate the list with new configuration data
+            self._populate_input_list(self.filter_combo.currentData() or "all")
+            
+            # Auto-select the first listed input - loading its new config overwrites
+            # every visible editor, so the panel only needs a reset when nothing is listed
+            row = self._first_shown_row()
+            if row >= 0:
+                self.input_list.setCurrentRow(row)
+            else:
+                self._reset_config_panel()
     
     def _reset_config_panel(self):
         """Reset all editors in the config panel to clear stale state"""
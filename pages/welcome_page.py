@@ -7,10 +7,9 @@ import sys
 import json
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QFileDialog, QFrame, QMessageBox, QGridLayout, QSizePolicy,
-    QGraphicsDropShadowEffect
+    QFileDialog, QFrame, QMessageBox, QGridLayout, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QColor
 
 from styles import COLORS
@@ -36,6 +35,38 @@ class PresetCard(QFrame):
     
     clicked = pyqtSignal(str)
     
+    HOVER_STYLE_DELAY_MS = 16  # One frame - a quick pass over a card never restyles it
+    
+    _TITLE_FONT = None  # Shared by every card, built with the first one
+    
+    # All card states in one sheet, applied once per card (the title accent
+    # differs per card); _update_style only switches the cardState property
+    _STYLE_TEMPLATE = """
+        PresetCard[cardState="default"] {{
+            background-color: rgba(55, 55, 55, 0.85);
+            border: none;
+            border-radius: 16px;
+        }}
+        PresetCard[cardState="hover"] {{
+            background-color: rgba(70, 70, 70, 0.9);
+            border: none;
+            border-radius: 16px;
+        }}
+        PresetCard[cardState="selected"] {{
+            background-color: rgba(90, 90, 90, 0.95);
+            border: none;
+            border-radius: 16px;
+        }}
+        QLabel#presetCardTitle {{
+            color: white;
+            background: transparent;
+        }}
+        PresetCard[cardState="hover"] QLabel#presetCardTitle,
+        PresetCard[cardState="selected"] QLabel#presetCardTitle {{
+            color: {accent};
+        }}
+    """
+    
     def __init__(self, preset_id: str, title: str, description: str,
                  accent_color: str = None, parent=None):
         super().__init__(parent)
@@ -43,6 +74,11 @@ class PresetCard(QFrame):
         self.selected = False
         self.hovered = False
         self.accent_color = accent_color or COLORS['accent_primary']
+        self._card_state = None  # cardState property last applied
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(self.HOVER_STYLE_DELAY_MS)
+        self._hover_timer.timeout.connect(self._update_style)
         self._setup_ui(title, description)
     
     def _setup_ui(self, title: str, description: str):
@@ -59,9 +95,11 @@ class PresetCard(QFrame):
         
         # Title
         self.title_label = QLabel(title)
-        self.title_label.setFont(QFont("", 18, QFont.Weight.Bold))
+        if PresetCard._TITLE_FONT is None:
+            PresetCard._TITLE_FONT = QFont("", 18, QFont.Weight.Bold)
+        self.title_label.setFont(PresetCard._TITLE_FONT)
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.title_label.setStyleSheet(f"color: white; background: transparent;")
+        self.title_label.setObjectName("presetCardTitle")
         layout.addWidget(self.title_label)
         
         # Description
@@ -74,52 +112,46 @@ class PresetCard(QFrame):
         layout.addStretch()
         
         # Apply initial style after labels are created
+        self.setStyleSheet(self._STYLE_TEMPLATE.format(accent=self.accent_color))
         self._update_style()
     
     def _update_style(self):
         if self.selected:
             # Selected state - brighter background
-            self.setStyleSheet(f"""
-                PresetCard {{
-                    background-color: rgba(90, 90, 90, 0.95);
-                    border: none;
-                    border-radius: 16px;
-                }}
-            """)
-            self.title_label.setStyleSheet(f"color: {self.accent_color}; background: transparent;")
+            state = 'selected'
         elif self.hovered:
             # Hover state - medium background
-            self.setStyleSheet(f"""
-                PresetCard {{
-                    background-color: rgba(70, 70, 70, 0.9);
-                    border: none;
-                    border-radius: 16px;
-                }}
-            """)
-            self.title_label.setStyleSheet(f"color: {self.accent_color}; background: transparent;")
+            state = 'hover'
         else:
             # Default state - subtle background
-            self.setStyleSheet(f"""
-                PresetCard {{
-                    background-color: rgba(55, 55, 55, 0.85);
-                    border: none;
-                    border-radius: 16px;
-                }}
-            """)
-            self.title_label.setStyleSheet(f"color: white; background: transparent;")
+            state = 'default'
+        
+        if state == self._card_state:
+            return  # e.g. hovering a selected card - nothing visible changes
+        self._card_state = state
+        self.setProperty('cardState', state)
+        # The title's color rule depends on the card's property, so repolish both
+        for widget in (self, self.title_label):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
     
     def set_selected(self, selected: bool):
+        if selected == self.selected:
+            return
         self.selected = selected
         self._update_style()
     
     def enterEvent(self, event):
-        self.hovered = True
-        self._update_style()
+        # Duplicate enter/leave events don't restart the hover timer
+        if not self.hovered:
+            self.hovered = True
+            self._hover_timer.start()
         super().enterEvent(event)
     
     def leaveEvent(self, event):
-        self.hovered = False
-        self._update_style()
+        if self.hovered:
+            self.hovered = False
+            self._hover_timer.start()
         super().leaveEvent(event)
     
     def mousePressEvent(self, event):
@@ -132,13 +164,42 @@ class WelcomePage(QWidget):
     
     config_loaded = pyqtSignal(object, bool)  # Emits (FullConfiguration, is_preset)
     
+    # Status pill styles - blue while a choice is pending, green once loaded
+    _STATUS_STYLE_SELECTED = f"""
+        color: {COLORS['accent_primary']};
+        font-size: 15px;
+        font-weight: 600;
+        padding: 16px 32px;
+        background-color: rgba(59, 130, 246, 0.2);
+        border-radius: 20px;
+        border: none;
+    """
+    _STATUS_STYLE_LOADED = f"""
+        color: {COLORS['success']};
+        font-size: 15px;
+        font-weight: 600;
+        padding: 16px 32px;
+        background-color: rgba(16, 185, 129, 0.2);
+        border-radius: 20px;
+        border: none;
+    """
+    
+    # Parsed preset files by name - read once, then only used to build fresh configs
+    _PRESET_DATA = {}
+    PRESET_NAMES = ("front_engine", "rear_engine")
+    
     def __init__(self, config: FullConfiguration, parent=None):
         super().__init__(parent)
         self.config = config
         self.selected_preset = None
         self.loaded_file_path = None  # Path to uploaded config file
         self.preset_cards = {}
+        self._selected_card = None  # The one card currently shown as selected
         self._setup_ui()
+        
+        # Read the preset files up front so Next doesn't wait on disk
+        for preset_name in self.PRESET_NAMES:
+            self._get_preset_data(preset_name)
     
     def _setup_ui(self):
         self.setStyleSheet("background-color: transparent;")
@@ -216,15 +277,7 @@ class WelcomePage(QWidget):
         # Status label with pill style
         self.status_label = QLabel("")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setStyleSheet(f"""
-            color: {COLORS['success']};
-            font-size: 15px;
-            font-weight: 600;
-            padding: 16px 32px;
-            background-color: rgba(16, 185, 129, 0.2);
-            border-radius: 20px;
-            border: none;
-        """)
+        self.status_label.setStyleSheet(self._STATUS_STYLE_LOADED)
         self.status_label.setVisible(False)
         layout.addWidget(self.status_label, alignment=Qt.AlignmentFlag.AlignCenter)
         
@@ -236,8 +289,7 @@ class WelcomePage(QWidget):
         self.loaded_file_path = None  # Clear any previously loaded file
         
         # Update card selection state
-        for card_id, card in self.preset_cards.items():
-            card.set_selected(card_id == preset_id)
+        self._select_card(preset_id)
         
         # Update status label to show selection (not loaded yet)
         if preset_id == "front_engine":
@@ -245,30 +297,52 @@ class WelcomePage(QWidget):
         elif preset_id == "rear_engine":
             self.status_label.setText("Rear Engine selected")
         
-        self.status_label.setStyleSheet(f"""
-            color: {COLORS['accent_primary']};
-            font-size: 15px;
-            font-weight: 600;
-            padding: 16px 32px;
-            background-color: rgba(59, 130, 246, 0.2);
-            border-radius: 20px;
-            border: none;
-        """)
+        self.status_label.setStyleSheet(self._STATUS_STYLE_SELECTED)
         self.status_label.setVisible(True)
     
+    def _select_card(self, preset_id):
+        """Show only the given card as selected (None clears the selection)"""
+        card = self.preset_cards.get(preset_id)
+        if card is self._selected_card:
+            return
+        if self._selected_card is not None:
+            self._selected_card.set_selected(False)
+        self._selected_card = card
+        if card is not None:
+            card.set_selected(True)
+    
     def _on_upload_clicked(self, preset_id: str):
         """Handle upload card click"""
         self._upload_config()
     
-    def _load_preset_file(self, preset_name: str) -> FullConfiguration:
-        """Load preset configuration from JSON file"""
+    def _get_preset_data(self, preset_name: str):
+        """Return the parsed preset JSON, reading the file on first use.
+        Returns None if the file is missing or invalid."""
+        if preset_name in WelcomePage._PRESET_DATA:
+            return WelcomePage._PRESET_DATA[preset_name]
+        
         # Find the presets directory (works in dev and PyInstaller bundle)
         preset_path = get_resource_path(os.path.join("presets", f"{preset_name}.json"))
-        
         try:
             with open(preset_path, 'r') as f:
                 preset_data = json.load(f)
-            
+        except FileNotFoundError:
+            print(f"Preset file not found: {preset_path}")
+            return None
+        except Exception as e:
+            print(f"Error loading preset: {e}")
+            return None
+        
+        WelcomePage._PRESET_DATA[preset_name] = preset_data
+        return preset_data
+    
+    def _load_preset_file(self, preset_name: str) -> FullConfiguration:
+        """Load preset configuration from JSON file"""
+        preset_data = self._get_preset_data(preset_name)
+        if preset_data is None:
+            return FullConfiguration()
+        
+        try:
             # Create configuration from preset data
             config = FullConfiguration()
             
@@ -300,9 +374,6 @@ class WelcomePage(QWidget):
             
             return config
             
-        except FileNotFoundError:
-            print(f"Preset file not found: {preset_path}")
-            return FullConfiguration()
         except Exception as e:
             print(f"Error loading preset: {e}")
             return FullConfiguration()
@@ -331,8 +402,9 @@ class WelcomePage(QWidget):
             case.ignition_mode = 'set_ignition'
         
         case.can_be_overridden = case_data.get('can_be_overridden', False)
-        case.must_be_on = case_data.get('must_be_on', [])
-        case.must_be_off = case_data.get('must_be_off', [])
+        # Copied - case_data may be a cached preset that later loads reuse
+        case.must_be_on = list(case_data.get('must_be_on', []))
+        case.must_be_off = list(case_data.get('must_be_off', []))
         case.require_ignition_on = case_data.get('require_ignition_on', False)
         case.require_ignition_off = case_data.get('require_ignition_off', False)
         case.require_security_on = case_data.get('require_security_on', False)
@@ -378,20 +450,11 @@ class WelcomePage(QWidget):
             self.selected_preset = "upload"
             
             # Update selection
-            for card_id, card in self.preset_cards.items():
-                card.set_selected(card_id == "upload")
+            self._select_card("upload")
             
             filename = os.path.basename(file_path)
             self.status_label.setText(f"File selected: {filename}")
-            self.status_label.setStyleSheet(f"""
-                color: {COLORS['accent_primary']};
-                font-size: 15px;
-                font-weight: 600;
-                padding: 16px 32px;
-                background-color: rgba(59, 130, 246, 0.2);
-                border-radius: 20px;
-                border: none;
-            """)
+            self.status_label.setStyleSheet(self._STATUS_STYLE_SELECTED)
             self.status_label.setVisible(True)
     
     def load_selected_config(self) -> tuple:
@@ -402,48 +465,22 @@ class WelcomePage(QWidget):
         if self.selected_preset == "front_engine":
             self.config = self._load_preset_file("front_engine")
             self.status_label.setText("✓ Front Engine preset loaded")
-            self.status_label.setStyleSheet(f"""
-                color: {COLORS['success']};
-                font-size: 15px;
-                font-weight: 600;
-                padding: 16px 32px;
-                background-color: rgba(16, 185, 129, 0.2);
-                border-radius: 20px;
-                border: none;
-            """)
+            self.status_label.setStyleSheet(self._STATUS_STYLE_LOADED)
             return (self.config, True)
         
         elif self.selected_preset == "rear_engine":
             self.config = self._load_preset_file("rear_engine")
             self.status_label.setText("✓ Rear Engine preset loaded")
-            self.status_label.setStyleSheet(f"""
-                color: {COLORS['success']};
-                font-size: 15px;
-                font-weight: 600;
-                padding: 16px 32px;
-                background-color: rgba(16, 185, 129, 0.2);
-                border-radius: 20px;
-                border: none;
-            """)
+            self.status_label.setStyleSheet(self._STATUS_STYLE_LOADED)
             return (self.config, True)
         
         elif self.selected_preset == "upload" and self.loaded_file_path:
             try:
                 with open(self.loaded_file_path, 'r') as f:
-                    json_str = f.read()
-                
-                self.config = FullConfiguration.from_json(json_str)
+                    self.config = FullConfiguration.from_dict(json.load(f))
                 filename = os.path.basename(self.loaded_file_path)
                 self.status_label.setText(f"✓ Loaded: {filename}")
-                self.status_label.setStyleSheet(f"""
-                    color: {COLORS['success']};
-                    font-size: 15px;
-                    font-weight: 600;
-                    padding: 16px 32px;
-                    background-color: rgba(16, 185, 129, 0.2);
-                    border-radius: 20px;
-                    border: none;
-                """)
+                self.status_label.setStyleSheet(self._STATUS_STYLE_LOADED)
                 return (self.config, False)
                 
             except Exception as e:
@@ -462,8 +499,7 @@ class WelcomePage(QWidget):
         """Reset page to initial state"""
         self.selected_preset = None
         self.loaded_file_path = None
-        for card in self.preset_cards.values():
-            card.set_selected(False)
+        self._select_card(None)
         self.status_label.setText("")
         self.status_label.setVisible(False)
         self.config = FullConfiguration()
@@ -315,6 +315,28 @@ QLabel#statusLabel {{
     background-color: rgba(60, 60, 60, 0.5);
 }}
 
+QLabel#pgnLabel {{
+    color: {COLORS['text_muted']};
+}}
+
+QLabel#expandLabel {{
+    color: {COLORS['text_muted']};
+    background: transparent;
+}}
+
+QLabel#devicesHeader {{
+    color: {COLORS['accent_blue']};
+}}
+
+QLabel#onSectionLabel {{
+    color: {COLORS['accent_green']};
+}}
+
+QLabel#offSectionLabel {{
+    color: {COLORS['accent_red']};
+    margin-top: 16px;
+}}
+
 /* ============================================
    Group Box - Solid backgrounds
    ============================================ */
@@ -369,6 +391,241 @@ QCheckBox::indicator:checked:hover {{
     background-color: {COLORS['accent_secondary']};
 }}
 
+/* ============================================
+   Output Config Rows - one per device output
+   ============================================ */
+
+QWidget#deviceOutputsContainer, QWidget#deviceOutputsContainer *,
+QWidget#outputConfigRow, QWidget#outputConfigRow * {{
+    background: transparent;
+}}
+
+QCheckBox#outputEnableCheck {{
+    color: {COLORS['text_primary']};
+    font-size: 13px;
+    spacing: 8px;
+    background: transparent;
+}}
+
+QCheckBox#outputEnableCheck::indicator {{
+    width: 20px;
+    height: 20px;
+    border-radius: 4px;
+    border: none;
+    background: rgba(80, 80, 80, 0.95);
+}}
+
+QCheckBox#outputEnableCheck::indicator:checked {{
+    background: {COLORS['accent_primary']};
+}}
+
+QCheckBox#outputEnableCheck::indicator:hover {{
+    background: rgba(100, 100, 100, 1.0);
+}}
+
+QCheckBox#outputEnableCheck::indicator:checked:hover {{
+    background: {COLORS['accent_secondary']};
+}}
+
+QFrame#outputModeCard, QFrame#outputModeCard QFrame {{
+    background-color: rgba(55, 55, 55, 0.95);
+    border-radius: 8px;
+}}
+
+QComboBox#outputModeCombo {{
+    padding: 4px 10px;
+    font-size: 13px;
+}}
+
+/* ============================================
+   Case Editors - state set via the caseState property
+   ============================================ */
+
+CaseEditor[caseState="disabled"] {{
+    background-color: {COLORS['bg_dark']};
+    border: 1px solid {COLORS['border_default']};
+    border-radius: 8px;
+}}
+
+CaseEditor[caseState="disabled"]:hover {{
+    border-color: {COLORS['text_muted']};
+}}
+
+CaseEditor[caseState="enabled"] {{
+    background-color: {COLORS['bg_light']};
+    border: 2px solid {COLORS['accent_green']};
+    border-radius: 8px;
+}}
+
+CaseEditor[caseState="enabled"]:hover {{
+    border-color: {COLORS['accent_blue']};
+}}
+
+CaseEditor[caseState="has_data"] {{
+    background-color: {COLORS['bg_dark']};
+    border: 2px solid {COLORS['accent_orange']};
+    border-radius: 8px;
+}}
+
+CaseEditor[caseState="has_data"]:hover {{
+    border-color: {COLORS['accent_yellow']};
+}}
+
+CaseEditor[caseState="expanded"] {{
+    background-color: {COLORS['bg_medium']};
+    border: 2px solid {COLORS['accent_blue']};
+    border-radius: 8px;
+}}
+
+_ClickableFrame#caseHeader[headerExpanded="true"] {{
+    background-color: {COLORS['bg_light']};
+    border-top-left-radius: 6px;
+    border-top-right-radius: 6px;
+}}
+
+QCheckBox#caseEnableCheck {{
+    color: {COLORS['text_primary']};
+    spacing: 10px;
+    background: transparent;
+}}
+
+QCheckBox#caseEnableCheck::indicator {{
+    width: 22px;
+    height: 22px;
+    border-radius: 5px;
+    border: 2px solid rgba(100, 100, 100, 0.8);
+    background: rgba(60, 60, 60, 0.9);
+}}
+
+QCheckBox#caseEnableCheck::indicator:hover {{
+    border-color: {COLORS['accent_blue']};
+    background: rgba(80, 80, 80, 1.0);
+}}
+
+QCheckBox#caseEnableCheck::indicator:checked {{
+    background: {COLORS['accent_green']};
+    border-color: {COLORS['accent_green']};
+}}
+
+QCheckBox#caseEnableCheck::indicator:checked:hover {{
+    background: {COLORS['accent_primary']};
+    border-color: {COLORS['accent_primary']};
+}}
+
+QLabel#caseDefaultLabel {{
+    color: {COLORS['text_muted']};
+    font-style: italic;
+    font-size: 11px;
+    background: transparent;
+}}
+
+QPushButton#caseClearButton {{
+    background-color: rgba(70, 70, 70, 0.9);
+    color: {COLORS['text_secondary']};
+    border: none;
+    border-radius: 5px;
+    font-size: 11px;
+    font-weight: 600;
+    padding: 4px 10px;
+    min-width: 50px;
+    max-width: 50px;
+}}
+
+QPushButton#caseClearButton:hover {{
+    background-color: {COLORS['danger']};
+    color: white;
+}}
+
+QComboBox#caseCardCombo {{
+    background-color: rgba(55, 55, 55, 0.95);
+    padding: 6px 12px;
+    border-radius: 8px;
+    font-size: 13px;
+}}
+
+QSpinBox#caseCardSpin {{
+    background-color: rgba(55, 55, 55, 0.95);
+    padding: 6px 12px;
+    border-radius: 8px;
+    font-size: 13px;
+}}
+
+QLabel#timerResultLabel {{
+    color: {COLORS['text_muted']};
+    background: transparent;
+}}
+
+QLabel#deviceOutputsLabel {{
+    color: {COLORS['accent_primary']};
+    font-weight: 700;
+    font-size: 13px;
+    margin-bottom: 8px;
+    background: transparent;
+}}
+
+QLabel#ignitionModeLabel {{
+    color: {COLORS['text_secondary']};
+    font-size: 11px;
+}}
+
+QComboBox#ignitionModeCombo {{
+    background: rgba(70, 70, 70, 0.9);
+    color: {COLORS['text_primary']};
+    border: 1px solid rgba(255, 255, 255, 0.1);
+    border-radius: 6px;
+    padding: 4px 8px;
+    font-size: 11px;
+}}
+
+QComboBox#ignitionModeCombo:hover {{
+    border: 1px solid {COLORS['accent_blue']};
+}}
+
+QComboBox#ignitionModeCombo::drop-down {{
+    border: none;
+    width: 20px;
+}}
+
+QComboBox#ignitionModeCombo QAbstractItemView {{
+    background: rgba(50, 50, 50, 0.95);
+    color: {COLORS['text_primary']};
+    selection-background-color: {COLORS['accent_blue']};
+}}
+
+QCheckBox#canOverrideCheck {{
+    color: {COLORS['text_primary']};
+    spacing: 6px;
+    background: transparent;
+}}
+
+QCheckBox#canOverrideCheck::indicator {{
+    width: 18px;
+    height: 18px;
+    border-radius: 4px;
+    background: rgba(70, 70, 70, 0.9);
+}}
+
+QCheckBox#canOverrideCheck::indicator:checked {{
+    background: {COLORS['accent_orange']};
+}}
+
+QCheckBox#requireIgnitionCheck {{
+    color: {COLORS['text_primary']};
+    spacing: 6px;
+    background: transparent;
+}}
+
+QCheckBox#requireIgnitionCheck::indicator {{
+    width: 18px;
+    height: 18px;
+    border-radius: 4px;
+    background: rgba(70, 70, 70, 0.9);
+}}
+
+QCheckBox#requireIgnitionCheck::indicator:checked {{
+    background: {COLORS['accent_blue']};
+}}
+
 /* ============================================
    Slider - Solid backgrounds
    ============================================ */
@@ -526,6 +783,10 @@ QFrame#separator {{
     max-height: 1px;
 }}
 
+QFrame#caseSeparator {{
+    background-color: {COLORS['border_default']};
+}}
+
 QFrame#glassCard {{
     background-color: rgba(55, 55, 55, 0.85);
     border: none;